@@ -11,6 +11,7 @@ from pathlib import Path
 from typing import Dict, Any, Optional, List, Tuple
 from datetime import datetime
 from loguru import logger
+from tradestat_ingestor.core.serialization import loads_json
 
 
 class ChangeDetector:
@@ -31,18 +32,23 @@ class ChangeDetector:
         """Get path to version history file for a specific HSN."""
         return self.versions_dir / f"{feature}_{trade_type}_{hsn}_history.json"
     
+    @staticmethod
+    def _load_history(history_path: Path) -> Optional[Dict]:
+        """Load a version history file, or None if it does not exist."""
+        try:
+            with open(history_path, 'rb') as f:
+                return loads_json(f.read())
+        except FileNotFoundError:
+            return None
+    
     def get_previous_version(self, feature: str, trade_type: str, hsn: str, year: str) -> Optional[Dict]:
         """Load previous version of data if it exists."""
         history_path = self.get_version_history_path(feature, trade_type, hsn)
         
-        if not history_path.exists():
-            return None
-        
         try:
-            with open(history_path, 'r') as f:
-                history = json.load(f)
-                if year in history and 'snapshot' in history[year]:
-                    return history[year]['snapshot']
+            history = self._load_history(history_path)
+            if history and year in history and 'snapshot' in history[year]:
+                return history[year]['snapshot']
         except Exception as e:
             logger.warning(f"Could not load version history: {e}")
         
@@ -203,11 +209,7 @@ class ChangeDetector:
         history_path = self.get_version_history_path(feature, trade_type, hsn)
         
         # Load existing history or create new
-        if history_path.exists():
-            with open(history_path, 'r') as f:
-                history = json.load(f)
-        else:
-            history = {}
+        history = self._load_history(history_path) or {}
         
         # Add new version
         history[year] = {
@@ -234,12 +236,10 @@ class ChangeDetector:
         """Generate comprehensive changelog for all versions of a specific HSN."""
         history_path = self.get_version_history_path(feature, trade_type, hsn)
         
-        if not history_path.exists():
-            return None
-        
         try:
-            with open(history_path, 'r') as f:
-                history = json.load(f)
+            history = self._load_history(history_path)
+            if history is None:
+                return None
             
             changelog = []
             years = sorted(history.keys())
@@ -271,12 +271,10 @@ class ChangeDetector:
         """Get detailed comparison report between current and previous version."""
         history_path = self.get_version_history_path(feature, trade_type, hsn)
         
-        if not history_path.exists():
-            return None
-        
         try:
-            with open(history_path, 'r') as f:
-                history = json.load(f)
+            history = self._load_history(history_path)
+            if history is None:
+                return None
             
             if year not in history:
                 return None
@@ -0,0 +1,178 @@
+"""
+Git publishing for scraped output files.
+
+Pushes output files to the data repository described by the GIT_* settings.
+Files are queued and flushed as a batch: one `git add` for every queued path,
+one commit and one push, instead of add/commit/push per file.
+"""
+
+import os
+import subprocess
+from pathlib import Path
+from typing import Iterable, List, Optional
+from loguru import logger
+
+
+def _git(repo_path: Path, *args: str, stdin: str = None) -> Optional[subprocess.CompletedProcess]:
+    """Run a git command in `repo_path`, returning None (and logging) on failure."""
+    try:
+        return subprocess.run(
+            ["git", "-C", str(repo_path), *args],
+            input=stdin,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError) as e:
+        stderr = getattr(e, "stderr", "") or ""
+        logger.error(f"git {args[0]} failed: {e} {stderr.strip()}")
+        return None
+
+
+def push_files_to_git(
+    files: Iterable,
+    repo_path,
+    message: str,
+    branch: str = None
+) -> bool:
+    """
+    Stage, commit and push `files` to the data repository in a single batch.
+
+    Args:
+        files: Paths of output files inside `repo_path`
+        repo_path: Root of the git working tree holding the output files
+        message: Commit message
+        branch: Branch to push (defaults to settings.git_branch)
+
+    Returns:
+        True if a commit was pushed, False if there was nothing to push or git failed
+    """
+    repo = Path(repo_path).resolve()
+    try:
+        paths = [Path(f).resolve().relative_to(repo).as_posix() for f in files]
+    except ValueError as e:
+        logger.error(f"Cannot push file outside {repo}: {e}")
+        return False
+    if not paths:
+        return False
+
+    if branch is None:
+        from tradestat_ingestor.config.settings import settings
+        branch = settings.git_branch
+
+    # Pass the pathspecs on stdin so large batches don't hit the argv limit
+    if _git(repo, "add", "--pathspec-from-file=-", stdin="\n".join(paths)) is None:
+        return False
+
+    # Only this batch's paths count; anything else already staged is left out of the commit
+    staged = _git(repo, "diff", "--cached", "--name-only", "--relative", "-z")
+    if staged is None:
+        return False
+    changed = sorted(set(staged.stdout.split("\0")).intersection(paths))
+    if not changed:
+        logger.info(f"No changes to commit for {len(paths)} file(s)")
+        return False
+
+    if _git(repo, "commit", "-m", message, "--pathspec-from-file=-", stdin="\n".join(changed)) is None:
+        return False
+    if _git(repo, "push", "origin", branch) is None:
+        return False
+
+    logger.success(f"Pushed {len(paths)} file(s) to {branch}")
+    return True
+
+
+class GitBatch:
+    """
+    Queue of output files pushed together on flush().
+
+    Use as a context manager so the queue is flushed when the batch ends:
+
+        with GitBatch(repo_path, "Update export data") as batch:
+            for path in saved_files:
+                batch.add(path)
+
+    By default everything is pushed in one commit at the end. Set
+    `flush_every` to also commit and push each time that many files are
+    queued, so an interrupted run keeps its earlier progress.
+    """
+
+    def __init__(
+        self,
+        repo_path,
+        message: str,
+        branch: str = None,
+        enabled: bool = None,
+        flush_every: int = 0
+    ):
+        """
+        Args:
+            repo_path: Root of the git working tree holding the output files
+            message: Commit message used for each flush
+            branch: Branch to push (defaults to settings.git_branch)
+            enabled: Push on flush (defaults to settings.git_enabled)
+            flush_every: Flush automatically once this many files are queued (0 = only on exit)
+        """
+        if enabled is None:
+            from tradestat_ingestor.config.settings import settings
+            enabled = settings.git_enabled
+        self.repo_path = Path(repo_path)
+        self.message = message
+        self.branch = branch
+        self.enabled = enabled
+        self.flush_every = flush_every
+        self.pending: List[Path] = []
+
+    def add(self, path) -> None:
+        """Queue `path` for the next flush."""
+        self.pending.append(Path(path))
+        self._maybe_flush()
+
+    def add_tree(self, directory, suffix: str = ".json") -> int:
+        """
+        Queue every file under `directory` whose name ends with `suffix`.
+
+        Walks the tree with os.scandir, whose entries already carry the file
+        type, so no extra stat is needed per file.
+
+        Returns:
+            Number of files queued
+        """
+        count = 0
+        stack = [os.fspath(directory)]
+        while stack:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if not entry.name.startswith("."):
+                            stack.append(entry.path)
+                    elif entry.name.endswith(suffix):
+                        self.pending.append(Path(entry.path))
+                        count += 1
+                        self._maybe_flush()
+        return count
+
+    def _maybe_flush(self) -> None:
+        if self.flush_every and len(self.pending) >= self.flush_every:
+            self.flush()
+
+    def flush(self) -> bool:
+        """Commit and push every queued file; returns True if a commit was pushed."""
+        if not self.pending:
+            return False
+        files, self.pending = self.pending, []
+        message = f"{self.message} ({len(files)} file(s))"
+        if not self.enabled:
+            logger.debug(f"Git push disabled; skipping {len(files)} file(s)")
+            return False
+        return push_files_to_git(files, self.repo_path, message, self.branch)
+
+    def __enter__(self) -> "GitBatch":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        # Don't publish the output of a run that failed part-way
+        if exc_type is None:
+            self.flush()
+        elif self.pending:
+            logger.warning(f"Batch aborted; not pushing {len(self.pending)} queued file(s)")
@@ -0,0 +1,144 @@
+"""
+On-disk response cache for scrapers.
+
+Stores raw HTML responses under a content-addressed key derived from the
+request parameters so repeated scrapes of the same report are served from
+disk instead of the network.
+"""
+
+import functools
+import gzip
+import hashlib
+import inspect
+import os
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Callable, Optional, Sequence
+
+from loguru import logger
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# Reports older than this many months are treated as settled
+SETTLED_AFTER_MONTHS = 3
+SETTLED_TTL = timedelta(days=30)
+RECENT_TTL = timedelta(days=1)
+
+# Supported entry codecs -> file suffix
+CODECS = {"gzip": ".html.gz", "zstd": ".html.zst"}
+# Fast level for cache entries; they are written once per fetch and read often
+ZSTD_CACHE_LEVEL = 3
+
+
+def cache_key(*parts) -> str:
+    """
+    Build a short hex cache key from request parameters.
+
+    Parts are compared as stripped, upper-cased strings, so "a1" and " A1"
+    (or "export" and "Export") share an entry; the scrapers treat them alike.
+    """
+    raw = "|".join(str(p).strip().upper() for p in parts)
+    return hashlib.blake2b(raw.encode(), digest_size=8).hexdigest()
+
+
+def ttl_for_period(month: int, year: int, now: Optional[datetime] = None) -> timedelta:
+    """
+    Cache lifetime for a monthly report.
+
+    Recent months still get revised upstream, so they expire after a day;
+    months at least SETTLED_AFTER_MONTHS old are kept for SETTLED_TTL.
+    """
+    now = now or datetime.now()
+    months_old = (now.year - year) * 12 + (now.month - month)
+    return SETTLED_TTL if months_old >= SETTLED_AFTER_MONTHS else RECENT_TTL
+
+
+def _compress(data: bytes, codec: str) -> bytes:
+    if codec == "zstd":
+        return zstandard.ZstdCompressor(level=ZSTD_CACHE_LEVEL).compress(data)
+    return gzip.compress(data)
+
+
+def _decompress(data: bytes, codec: str) -> bytes:
+    if codec == "zstd":
+        return zstandard.ZstdDecompressor().decompress(data)
+    return gzip.decompress(data)
+
+
+def read_cached(cache_dir, key: str, ttl: timedelta, codec: str = "gzip") -> Optional[str]:
+    """Return the cached response for `key` if present and younger than `ttl`."""
+    path = Path(cache_dir) / f"{key}{CODECS[codec]}"
+    try:
+        age = time.time() - path.stat().st_mtime
+    except FileNotFoundError:
+        return None
+    if age > ttl.total_seconds():
+        return None
+    try:
+        return _decompress(path.read_bytes(), codec).decode("utf-8")
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable cache entry {path}: {e}")
+        return None
+
+
+def write_cached(cache_dir, key: str, text: str, codec: str = "gzip") -> None:
+    """Store a response for `key`, replacing any previous entry atomically."""
+    directory = Path(cache_dir)
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / f"{key}{CODECS[codec]}"
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        tmp_path.write_bytes(_compress(text.encode("utf-8"), codec))
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.warning(f"Failed to write cache entry {path}: {e}")
+        tmp_path.unlink(missing_ok=True)
+
+
+def response_cache(key_fields: Sequence[str], codec: str = "gzip") -> Callable:
+    """
+    Decorator adding an optional on-disk cache to a scrape function.
+
+    The wrapped function gains a keyword-only `cache_dir` argument; when it is
+    None (the default) the function behaves exactly as before. The cache key
+    is built from the named arguments in `key_fields`, and the TTL from the
+    `month`/`year` arguments (see ttl_for_period). Failed scrapes (None) are
+    never cached. Entries are compressed with `codec` ("gzip" or "zstd").
+    """
+    if codec not in CODECS:
+        raise ValueError(f"Unsupported cache codec: {codec}")
+    if codec == "zstd" and zstandard is None:
+        logger.warning("zstandard is not installed; caching responses with gzip instead")
+        codec = "gzip"
+
+    def decorator(func: Callable) -> Callable:
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(*args, cache_dir=None, **kwargs):
+            if cache_dir is None:
+                return func(*args, **kwargs)
+
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            params = bound.arguments
+            key = cache_key(*(params[name] for name in key_fields))
+            ttl = ttl_for_period(params["month"], params["year"])
+
+            cached = read_cached(cache_dir, key, ttl, codec)
+            if cached is not None:
+                logger.info(f"Cache hit for {func.__name__}: key={key}")
+                return cached
+
+            text = func(*args, **kwargs)
+            if text is not None:
+                write_cached(cache_dir, key, text, codec)
+            return text
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,262 @@
+"""
+JSON serialization helpers for scraper output files.
+
+Encodes with orjson when available (falling back to the stdlib encoder) and
+writes each document with a single buffer instead of streaming many small
+writes. Optionally compresses documents with zstandard. Output directories
+are created once per process, and documents whose content (ignoring
+per-run timestamps) matches the file already on disk are not rewritten.
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import re
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Iterable, Optional, Set
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# Set TRADESTAT_COMPACT_JSON=1 to write compact JSON instead of 2-space indented
+COMPACT_JSON = os.getenv("TRADESTAT_COMPACT_JSON", "").lower() in ("1", "true", "yes")
+
+# Optional zstd dictionary (see train_zstd_dictionary); files compressed with a
+# dictionary can only be decompressed with the same dictionary
+ZSTD_DICT_PATH = os.getenv("TRADESTAT_ZSTD_DICT", "")
+ZSTD_LEVEL = 7
+
+# Fields that differ on every run (or hold the digest itself); ignored by content_digest
+_VOLATILE_FIELDS = frozenset({
+    "scraped_at",
+    "processing_timestamp",
+    "saved_at",
+    "extraction_duration_seconds",
+    "content_digest",
+})
+
+# The data_manifest object, and the digest stored in it. The regex only
+# matches a flat manifest (no nested objects, no braces in string values);
+# anything else falls back to decoding the manifest (see _manifest_digest).
+_MANIFEST_RE = re.compile(rb'"data_manifest":\s*\{([^{}]*)\}')
+_DIGEST_RE = re.compile(rb'"content_digest":\s*"([0-9a-f]+)"')
+
+# Output directories already created in this process
+_created_dirs: Set[str] = set()
+
+
+def dumps_json(data: Any, pretty: Optional[bool] = None) -> bytes:
+    """
+    Serialize `data` to UTF-8 JSON bytes.
+
+    With orjson the output matches json.dumps(indent=2, ensure_ascii=False)
+    except for floats: exponents are written without "+" or zero padding
+    (1e16, 1.5e-7 rather than 1e+16, 1.5e-07), and NaN/Infinity become null.
+
+    Args:
+        data: JSON-serializable object
+        pretty: Indent with 2 spaces; defaults to the TRADESTAT_COMPACT_JSON setting
+
+    Returns:
+        Encoded JSON document
+    """
+    if pretty is None:
+        pretty = not COMPACT_JSON
+
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, option=option)
+
+    if pretty:
+        return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def loads_json(buf: bytes) -> Any:
+    """Decode a UTF-8 JSON document from bytes, without an intermediate str."""
+    if orjson is not None:
+        return orjson.loads(buf)
+    return json.loads(buf)
+
+
+def write_bytes(path, buf: bytes) -> None:
+    """Write `buf` to `path` (truncating) with as few write syscalls as possible."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(buf)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+    finally:
+        os.close(fd)
+
+
+def ensure_dir(directory) -> None:
+    """Create `directory` (and parents) once per process, skipping repeat mkdir calls."""
+    key = os.fspath(directory)
+    if key not in _created_dirs:
+        os.makedirs(key, exist_ok=True)
+        _created_dirs.add(key)
+
+
+def _strip_volatile(obj: Any) -> Any:
+    """Copy of `obj` without any _VOLATILE_FIELDS keys, at any depth."""
+    if isinstance(obj, dict):
+        return {k: _strip_volatile(v) for k, v in obj.items() if k not in _VOLATILE_FIELDS}
+    if isinstance(obj, list):
+        return [_strip_volatile(v) for v in obj]
+    return obj
+
+
+def content_digest(data: Any, pretty: Optional[bool] = None) -> str:
+    """
+    Digest of the serialized document, ignoring per-run timestamps.
+
+    Covers every other field (metadata, schema version, headers, ...) and the
+    output format, so any change that would alter the written file besides
+    its timestamps produces a different digest.
+
+    Args:
+        data: JSON-serializable document
+        pretty: Output format, as for dumps_json
+    """
+    return hashlib.blake2b(dumps_json(_strip_volatile(data), pretty), digest_size=16).hexdigest()
+
+
+def _manifest_digest(buf) -> Optional[str]:
+    """Read data_manifest.content_digest from a serialized document."""
+    start = buf.rfind(b'"data_manifest"')
+    if start < 0:
+        return None
+    manifest = _MANIFEST_RE.match(buf, start)
+    if manifest is not None:
+        digest = _DIGEST_RE.search(manifest.group(1))
+        return digest.group(1).decode() if digest else None
+
+    # Not a flat object: decode the tail, which closes the top-level document
+    try:
+        manifest = loads_json(b"{" + buf[start:]).get("data_manifest")
+    except ValueError:
+        return None
+    digest = manifest.get("content_digest") if isinstance(manifest, dict) else None
+    return digest if isinstance(digest, str) else None
+
+
+def stored_content_digest(path) -> Optional[str]:
+    """Return the data_manifest.content_digest stored in an existing output file, if any."""
+    try:
+        if os.fspath(path).endswith(".zst"):
+            with open(path, 'rb') as f:
+                return _manifest_digest(decompress_zstd(f.read()))
+        with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return _manifest_digest(mm)
+    except (OSError, ValueError, ImportError):
+        # Missing, empty or unreadable file
+        return None
+
+
+def is_unchanged(path, data: dict) -> bool:
+    """
+    Report whether `path` already holds `data`, ignoring per-run timestamps.
+
+    Documents without a data_manifest are never considered unchanged.
+    """
+    if not isinstance(data.get("data_manifest"), dict):
+        return False
+    return stored_content_digest(path) == content_digest(data)
+
+
+def write_json_if_changed(path, data: dict, force: bool = False, compress: bool = False) -> bool:
+    """
+    Write `data` as JSON to `path` unless the file already holds the same document.
+
+    Documents are compared by content_digest, stored in data_manifest, so only
+    per-run timestamps are ignored; any other change, including schema version
+    or output format, is written. The digest is recorded in data["data_manifest"]
+    before writing.
+
+    Args:
+        path: Output file path
+        data: Document to write
+        force: Write without reading the stored document
+        compress: Compress the document with zstd (see compress_zstd)
+
+    Returns:
+        True if the file was written, False if it was left unchanged
+    """
+    manifest = data.get("data_manifest")
+    if isinstance(manifest, dict):
+        digest = content_digest(data)
+        if not force and stored_content_digest(path) == digest:
+            return False
+        manifest["content_digest"] = digest
+
+    buf = dumps_json(data)
+    if compress:
+        buf = compress_zstd(buf)
+    write_bytes(path, buf)
+    return True
+
+
+@lru_cache(maxsize=1)
+def _zstd_dict() -> Optional["zstandard.ZstdCompressionDict"]:
+    """Load the configured zstd dictionary once, if any."""
+    if not ZSTD_DICT_PATH:
+        return None
+    return zstandard.ZstdCompressionDict(Path(ZSTD_DICT_PATH).read_bytes())
+
+
+def _require_zstandard() -> None:
+    if zstandard is None:
+        raise ImportError("zstandard is required for compressed output: pip install zstandard")
+
+
+def compress_zstd(buf: bytes) -> bytes:
+    """Compress `buf` with zstd, using the configured dictionary if set."""
+    _require_zstandard()
+    dict_data = _zstd_dict()
+    if dict_data is None:
+        return zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(buf)
+    return zstandard.ZstdCompressor(level=ZSTD_LEVEL, dict_data=dict_data).compress(buf)
+
+
+def decompress_zstd(buf: bytes) -> bytes:
+    """Decompress a buffer produced by compress_zstd."""
+    _require_zstandard()
+    dict_data = _zstd_dict()
+    if dict_data is None:
+        return zstandard.ZstdDecompressor().decompress(buf)
+    return zstandard.ZstdDecompressor(dict_data=dict_data).decompress(buf)
+
+
+def train_zstd_dictionary(sample_files: Iterable, output_file, dict_size: int = 128 * 1024) -> Path:
+    """
+    Train a zstd dictionary from existing (uncompressed) JSON outputs.
+
+    Point TRADESTAT_ZSTD_DICT at the resulting file to use it for compression.
+
+    Args:
+        sample_files: Paths of representative JSON output files (~100 is plenty)
+        output_file: Where to write the dictionary
+        dict_size: Maximum dictionary size in bytes
+
+    Returns:
+        Path to the written dictionary
+    """
+    _require_zstandard()
+    samples = [Path(p).read_bytes() for p in sample_files]
+    dictionary = zstandard.train_dictionary(dict_size, samples)
+    output_path = Path(output_file)
+    output_path.write_bytes(dictionary.as_bytes())
+    return output_path
@@ -1,15 +1,23 @@
+import httpx
 import requests
 from bs4 import BeautifulSoup
 from loguru import logger
+from requests.adapters import HTTPAdapter
+
+# Keep-alive connections kept per host, so batch scrapes reuse sockets
+DEFAULT_POOL_SIZE = 32
 
 class TradeStatSession:
-    def __init__(self, base_url: str, user_agent: str):
+    def __init__(self, base_url: str, user_agent: str, pool_size: int = DEFAULT_POOL_SIZE):
         self.base_url = base_url
         self.session = requests.Session()
         self.session.headers.update({
             "User-Agent": user_agent,
             "Referer": base_url,
         })
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
 
     def bootstrap(self, path: str):
         url = f"{self.base_url}{path}"
@@ -36,3 +44,36 @@ class TradeStatSession:
         return {
             "_token": csrf_token,
         }
+
+
+def create_async_client(
+    base_url: str,
+    user_agent: str,
+    cookies=None,
+    concurrency: int = DEFAULT_POOL_SIZE
+) -> httpx.AsyncClient:
+    """
+    Create an HTTP/2 AsyncClient suitable for batch scraping.
+
+    Args:
+        base_url: Base URL of tradestat website
+        user_agent: User-Agent header value
+        cookies: Cookie jar from a bootstrapped session (e.g. TradeStatSession.session.cookies)
+                 so the CSRF token in `state` stays valid for this client
+        concurrency: Connection pool size, should match the batch concurrency
+
+    Returns:
+        httpx.AsyncClient; caller is responsible for closing it
+    """
+    return httpx.AsyncClient(
+        http2=True,
+        headers={
+            "User-Agent": user_agent,
+            "Referer": base_url,
+        },
+        cookies=cookies,
+        limits=httpx.Limits(
+            max_connections=concurrency,
+            max_keepalive_connections=concurrency,
+        ),
+    )
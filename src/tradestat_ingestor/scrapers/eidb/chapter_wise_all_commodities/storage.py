@@ -3,11 +3,18 @@ Storage module for EIDB Chapter-wise All Commodities data.
 Handles saving parsed data to JSON files with proper directory structure.
 """
 
-import json
 import os
+from functools import lru_cache
 from typing import Dict, Any
 from loguru import logger
 from datetime import datetime
+from tradestat_ingestor.core.serialization import dumps_json, ensure_dir, write_bytes
+
+
+@lru_cache(maxsize=64)
+def _dir_for(base_dir: str, trade_type: str) -> str:
+    """Output directory for a (base_dir, trade_type) combination."""
+    return os.path.join(base_dir, "eidb", "chapter_wise_all_commodities", trade_type.lower())
 
 
 def get_output_path(
@@ -29,12 +36,7 @@ def get_output_path(
         Full path to the output JSON file
     """
     # Build path: base_dir/eidb/chapter_wise_all_commodities/{trade_type}/{year}_{value_type}.json
-    output_dir = os.path.join(
-        base_dir,
-        "eidb",
-        "chapter_wise_all_commodities",
-        trade_type.lower()
-    )
+    output_dir = _dir_for(base_dir, trade_type)
     
     filename = f"{year}_{value_type.lower()}.json"
     return os.path.join(output_dir, filename)
@@ -63,7 +65,7 @@ def save_chapter_wise_data(
     output_path = get_output_path(base_dir, trade_type, year, value_type)
     
     # Create directory if it doesn't exist
-    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    ensure_dir(os.path.dirname(output_path))
     
     # Add storage metadata
     data["storage"] = {
@@ -74,8 +76,7 @@ def save_chapter_wise_data(
     }
     
     # Write JSON file
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    write_bytes(output_path, dumps_json(data))
     
     logger.success(f"Saved chapter-wise all commodities data to: {output_path}")
     return output_path
@@ -36,7 +36,7 @@ from tradestat_ingestor.config.settings import settings
 
 
 # Available years for scraping
-AVAILABLE_YEARS = ["2024", "2023", "2022", "2021", "2020", "2019", "2018"]
+AVAILABLE_YEARS = ("2024", "2023", "2022", "2021", "2020", "2019", "2018")
 
 
 def main():
@@ -97,6 +97,11 @@ def main():
         "--output",
         help="Custom output directory (optional)"
     )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Rewrite output files even if their content is unchanged"
+    )
     
     args = parser.parse_args()
     
@@ -199,7 +204,8 @@ def main():
                                 args.hscode,
                                 year,
                                 args.type,
-                                args.value_type
+                                args.value_type,
+                                force=args.force
                             )
                         else:
                             filepath = save_all_commodities_data(
@@ -207,7 +213,8 @@ def main():
                                 args.digit_level,
                                 year,
                                 args.type,
-                                args.value_type
+                                args.value_type,
+                                force=args.force
                             )
                         
                         print(f"   [+] Saved to: {filepath}")
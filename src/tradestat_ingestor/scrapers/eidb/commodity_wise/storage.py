@@ -3,18 +3,25 @@ Storage utilities for commodity-wise data.
 Handles saving scraped data to JSON files.
 """
 
-import json
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any
 from loguru import logger
 from datetime import datetime
+from tradestat_ingestor.core.serialization import ensure_dir, write_json_if_changed
 
 
-def get_output_dir(trade_type: str = "export") -> Path:
-    """Get the output directory for commodity-wise data."""
+@lru_cache(maxsize=16)
+def _dir_for(trade_type: str) -> Path:
+    """Output directory path for a trade type."""
     data_root = Path(__file__).parent.parent.parent.parent / "data"
-    output_dir = data_root / "raw" / "commodity_wise" / trade_type
-    output_dir.mkdir(parents=True, exist_ok=True)
+    return data_root / "raw" / "commodity_wise" / trade_type
+
+
+def get_output_dir(trade_type: str = "export") -> Path:
+    """Get the output directory for commodity-wise data, creating it if needed."""
+    output_dir = _dir_for(trade_type)
+    ensure_dir(output_dir)
     return output_dir
 
 
@@ -23,7 +30,8 @@ def save_commodity_wise_data(
     hscode: str,
     year: str,
     trade_type: str = "export",
-    value_type: str = "usd"
+    value_type: str = "usd",
+    force: bool = False
 ) -> Path:
     """
     Save commodity-wise data to a JSON file.
@@ -34,6 +42,7 @@ def save_commodity_wise_data(
         year: Financial year
         trade_type: "export" or "import"
         value_type: "usd", "inr", or "quantity"
+        force: Write even if the stored document is unchanged
         
     Returns:
         Path to the saved file
@@ -44,9 +53,10 @@ def save_commodity_wise_data(
     filename = f"{hscode}_{year}_{value_type}.json"
     filepath = output_dir / filename
     
-    with open(filepath, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
-    
+    if not write_json_if_changed(filepath, data, force):
+        logger.info(f"Data unchanged, skipping write: {filepath}")
+        return filepath
+
     logger.success(f"Saved commodity-wise data to: {filepath}")
     return filepath
 
@@ -56,7 +66,8 @@ def save_all_commodities_data(
     digit_level: int,
     year: str,
     trade_type: str = "export",
-    value_type: str = "usd"
+    value_type: str = "usd",
+    force: bool = False
 ) -> Path:
     """
     Save all commodities data at a digit level to a JSON file.
@@ -67,6 +78,7 @@ def save_all_commodities_data(
         year: Financial year
         trade_type: "export" or "import"
         value_type: "usd", "inr", or "quantity"
+        force: Write even if the stored document is unchanged
         
     Returns:
         Path to the saved file
@@ -77,8 +89,9 @@ def save_all_commodities_data(
     filename = f"all_{digit_level}digit_{year}_{value_type}.json"
     filepath = output_dir / filename
     
-    with open(filepath, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
-    
+    if not write_json_if_changed(filepath, data, force):
+        logger.info(f"Data unchanged, skipping write: {filepath}")
+        return filepath
+
     logger.success(f"Saved all commodities data to: {filepath}")
     return filepath
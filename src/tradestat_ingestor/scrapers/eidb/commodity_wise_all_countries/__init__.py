@@ -5,5 +5,22 @@ Fetches export and import data for specific HSN codes across all countries.
 
 from .export import scrape_commodity_export
 from .import_scraper import scrape_commodity_import
+from .scraper_async import (
+    scrape_commodity_async,
+    scrape_all_years,
+    scrape_all_years_to_file,
+    scrape_all_years_concurrent
+)
+from .consolidator import ConsolidatedWriter, consolidate_years, read_consolidated_summary
 
-__all__ = ["scrape_commodity_export", "scrape_commodity_import"]
+__all__ = [
+    "scrape_commodity_export",
+    "scrape_commodity_import",
+    "scrape_commodity_async",
+    "scrape_all_years",
+    "scrape_all_years_to_file",
+    "scrape_all_years_concurrent",
+    "ConsolidatedWriter",
+    "consolidate_years",
+    "read_consolidated_summary"
+]
@@ -3,9 +3,17 @@ Consolidator for multi-year commodity data.
 Merges parsed data from multiple years into a single JSON structure.
 """
 
-from typing import Dict, List, Any
+import mmap
+import os
+import re
+from typing import Dict, List, Any, Optional
 from datetime import datetime
 from loguru import logger
+from tradestat_ingestor.core.serialization import dumps_json, ensure_dir
+
+# Summary counts in the top-level metadata block
+_YEARS_COUNT_RE = re.compile(rb'"years_count":\s*(\d+)')
+_TOTAL_COUNTRIES_RE = re.compile(rb'"total_countries":\s*(\d+)')
 
 
 def consolidate_years(
@@ -29,8 +37,8 @@ def consolidate_years(
         logger.warning(f"No parsed data to consolidate for HSN={hsn}")
         return {}
     
-    # Sort years in descending order
-    sorted_years = sorted(parsed_years_data.keys(), reverse=True)
+    # Sort years in descending numeric order
+    sorted_years = sorted(parsed_years_data.items(), key=lambda item: int(item[0]), reverse=True)
     
     consolidated = {
         "hsn_code": hsn,
@@ -39,19 +47,60 @@ def consolidate_years(
             "consolidated_at": datetime.now().isoformat(),
             "trade_type": trade_type,
             "years_count": len(sorted_years),
+            "total_countries": 0,
             "schema_version": "2.0",
         }
     }
     
     # Add each year's data
-    for year in sorted_years:
-        if parsed_years_data[year]:
-            consolidated["years"][year] = parsed_years_data[year]
+    years = consolidated["years"]
+    for year, year_data in sorted_years:
+        if year_data:
+            years[year] = year_data
+    consolidated["metadata"]["total_countries"] = count_countries(years)
     
     logger.success(f"Consolidated {len(sorted_years)} years for HSN={hsn}")
     return consolidated
 
 
+def count_countries(years: Dict[str, Dict[str, Any]]) -> int:
+    """Total number of country rows across all years of a consolidated structure."""
+    return sum(len(year_data.get("countries") or ()) for year_data in years.values())
+
+
+def read_consolidated_summary(path) -> Optional[Dict[str, Any]]:
+    """
+    Read years_count and total_countries from a consolidated file without parsing it.
+
+    The top-level metadata block is the last key in both consolidate_years and
+    ConsolidatedWriter output, so only the bytes after the final "metadata"
+    key are scanned.
+
+    Args:
+        path: Path to a consolidated JSON file
+
+    Returns:
+        Dict with years_count and total_countries (None if not recorded),
+        or None if the file is missing or has no metadata block
+    """
+    try:
+        with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            start = mm.rfind(b'"metadata"')
+            if start < 0:
+                return None
+            years = _YEARS_COUNT_RE.search(mm, start)
+            total = _TOTAL_COUNTRIES_RE.search(mm, start)
+            if years is None:
+                return None
+            return {
+                "years_count": int(years.group(1)),
+                "total_countries": int(total.group(1)) if total else None,
+            }
+    except (OSError, ValueError):
+        # Missing, empty or unreadable file
+        return None
+
+
 def merge_consolidated_files(
     consolidated_list: List[Dict[str, Any]]
 ) -> Dict[str, Any]:
@@ -78,6 +127,80 @@ def merge_consolidated_files(
         
         # Update metadata
         merged["metadata"]["years_count"] = len(merged["years"])
+        merged["metadata"]["total_countries"] = count_countries(merged["years"])
         merged["metadata"]["consolidated_at"] = datetime.now().isoformat()
     
     return merged
+
+
+class ConsolidatedWriter:
+    """
+    Stream a consolidated multi-year file to disk one year at a time.
+
+    Produces the same top-level keys as consolidate_years, but each year is
+    encoded and written as soon as it is added, so only one year's parsed
+    data needs to be held in memory. Years appear in the order they are
+    added. The file is written under a temporary name and moved into place
+    on close, so readers never see a partial document; nothing is written if
+    no year was added.
+
+        with ConsolidatedWriter(path, hsn, "export") as writer:
+            writer.add_year("2024", parsed_2024)
+    """
+
+    def __init__(self, output_path, hsn: str, trade_type: str):
+        """
+        Args:
+            output_path: Path of the consolidated JSON file
+            hsn: HSN code
+            trade_type: "export" or "import"
+        """
+        self.output_path = os.fspath(output_path)
+        self.hsn = hsn
+        self.trade_type = trade_type
+        self.years_count = 0
+        self.total_countries = 0
+        self._tmp_path = f"{self.output_path}.{os.getpid()}.tmp"
+        self._file = None
+
+    def __enter__(self) -> "ConsolidatedWriter":
+        ensure_dir(os.path.dirname(self.output_path) or ".")
+        self._file = open(self._tmp_path, "wb")
+        self._file.write(b'{"hsn_code":' + dumps_json(self.hsn, pretty=False) + b',"years":{')
+        return self
+
+    def add_year(self, year: str, year_data: Dict[str, Any]) -> None:
+        """
+        Encode and write one year's parsed data, handing it to the OS
+        immediately so the caller can drop `year_data` right away.
+        """
+        if not year_data:
+            return
+        prefix = b"," if self.years_count else b""
+        # Write the small key separately so the encoded year isn't copied again
+        self._file.write(prefix + dumps_json(str(year), pretty=False) + b":")
+        self._file.write(dumps_json(year_data, pretty=False))
+        self._file.flush()
+        self.years_count += 1
+        self.total_countries += len(year_data.get("countries") or ())
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        try:
+            if exc_type is None:
+                metadata = {
+                    "consolidated_at": datetime.now().isoformat(),
+                    "trade_type": self.trade_type,
+                    "years_count": self.years_count,
+                    "total_countries": self.total_countries,
+                    "schema_version": "2.0",
+                }
+                self._file.write(b'},"metadata":' + dumps_json(metadata, pretty=False) + b"}")
+        finally:
+            self._file.close()
+
+        if exc_type is not None or not self.years_count:
+            # Leave any existing file untouched rather than replacing it with an empty one
+            os.unlink(self._tmp_path)
+            return
+        os.replace(self._tmp_path, self.output_path)
+        logger.success(f"Consolidated {self.years_count} years for HSN={self.hsn} to: {self.output_path}")
@@ -0,0 +1,200 @@
+"""
+Async commodity-wise all countries scraper.
+Fetches every year for an HSN code concurrently over one HTTP/2 client that
+shares a single bootstrapped CSRF state.
+"""
+
+import asyncio
+from loguru import logger
+from typing import Any, Dict, Iterable, Optional
+
+import httpx
+
+from tradestat_ingestor.core.session import create_async_client
+from tradestat_ingestor.utils.constants import EXPORT_PATH
+from .consolidator import ConsolidatedWriter, consolidate_years
+from .parser import parse_commodity_html
+
+# EidbReport_cmace flag per trade type (export and import share one endpoint)
+REPORT_FLAGS = {"export": "2", "import": "1"}
+
+# Maximum number of in-flight POSTs per HSN
+DEFAULT_CONCURRENCY = 8
+
+
+async def scrape_commodity_async(
+    client: httpx.AsyncClient,
+    base_url: str,
+    hsn: str,
+    year: str,
+    state: dict,
+    trade_type: str = "export"
+) -> Optional[str]:
+    """
+    Async variant of scrape_commodity_export / scrape_commodity_import.
+
+    Args:
+        client: httpx.AsyncClient sharing cookies with the bootstrapped session
+        base_url: Base URL of tradestat website
+        hsn: HSN code (e.g., "09011112")
+        year: Financial year (e.g., "2024")
+        state: Dictionary containing CSRF token and other auth state
+        trade_type: "export" or "import"
+
+    Returns:
+        HTML response as string, or None if request fails
+    """
+    report_flag = REPORT_FLAGS.get(trade_type)
+    if report_flag is None:
+        logger.error(f"Invalid trade_type: {trade_type}. Must be 'export' or 'import'")
+        return None
+
+    payload = {
+        "_token": state["_token"],
+        "Eidbhscode_cmace": hsn,
+        "EidbYear_cmace": year,
+        "EidbReport_cmace": report_flag,
+    }
+
+    logger.info(f"Scraping {trade_type}: HSN={hsn}, YEAR={year}")
+
+    try:
+        resp = await client.post(base_url + EXPORT_PATH, data=payload, timeout=60)
+        resp.raise_for_status()
+        logger.success(f"{trade_type.capitalize()} scrape successful: HSN={hsn}, YEAR={year}")
+        return resp.text
+    except Exception as e:
+        logger.error(f"{trade_type.capitalize()} scrape failed: HSN={hsn}, YEAR={year}, Error: {e}")
+        return None
+
+
+async def scrape_all_years(
+    client: httpx.AsyncClient,
+    base_url: str,
+    hsn: str,
+    years: Iterable[str],
+    state: dict,
+    trade_type: str = "export",
+    concurrency: int = DEFAULT_CONCURRENCY
+) -> Dict[str, Any]:
+    """
+    Scrape, parse and consolidate all `years` for one HSN code.
+
+    Requests run concurrently on `client`; each response is parsed in a worker
+    thread as soon as it arrives so parsing overlaps the remaining requests.
+
+    Args:
+        client: httpx.AsyncClient sharing cookies with the bootstrapped session
+        base_url: Base URL of tradestat website
+        hsn: HSN code
+        years: Financial years to scrape
+        state: Dictionary containing CSRF token and other auth state
+        trade_type: "export" or "import"
+        concurrency: Maximum number of simultaneous requests
+
+    Returns:
+        Consolidated data (see consolidate_years); empty if no year succeeded
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _run(year: str):
+        return year, await _fetch_and_parse(client, base_url, hsn, year, state, trade_type, semaphore)
+
+    results = await asyncio.gather(*(_run(year) for year in years))
+    parsed = {year: data for year, data in results if data}
+    return consolidate_years(hsn, trade_type, parsed)
+
+
+async def scrape_all_years_to_file(
+    client: httpx.AsyncClient,
+    base_url: str,
+    hsn: str,
+    years: Iterable[str],
+    state: dict,
+    output_path,
+    trade_type: str = "export",
+    concurrency: int = DEFAULT_CONCURRENCY
+) -> Optional[str]:
+    """
+    Like scrape_all_years, but stream each year into `output_path` with a
+    ConsolidatedWriter as soon as it is parsed instead of building the
+    consolidated dict in memory. Years are written in completion order, so a
+    slow year never holds the others in memory.
+
+    Args:
+        client: httpx.AsyncClient sharing cookies with the bootstrapped session
+        base_url: Base URL of tradestat website
+        hsn: HSN code
+        years: Financial years to scrape
+        state: Dictionary containing CSRF token and other auth state
+        output_path: Path of the consolidated JSON file
+        trade_type: "export" or "import"
+        concurrency: Maximum number of simultaneous requests
+
+    Returns:
+        Path to the saved file, or None if no year succeeded
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    with ConsolidatedWriter(output_path, hsn, trade_type) as writer:
+        async def _run(year: str) -> None:
+            data = await _fetch_and_parse(client, base_url, hsn, year, state, trade_type, semaphore)
+            writer.add_year(year, data)
+
+        await asyncio.gather(*(_run(year) for year in years))
+
+    if not writer.years_count:
+        logger.warning(f"No parsed data to consolidate for HSN={hsn}")
+        return None
+    return writer.output_path
+
+
+async def _fetch_and_parse(
+    client: httpx.AsyncClient,
+    base_url: str,
+    hsn: str,
+    year: str,
+    state: dict,
+    trade_type: str,
+    semaphore: asyncio.Semaphore
+) -> Optional[Dict[str, Any]]:
+    """Fetch one year under `semaphore` and parse it in a worker thread."""
+    async with semaphore:
+        html = await scrape_commodity_async(client, base_url, hsn, year, state, trade_type)
+    if html is None:
+        return None
+    return await asyncio.to_thread(parse_commodity_html, html, hsn, year)
+
+
+def scrape_all_years_concurrent(
+    base_url: str,
+    user_agent: str,
+    hsn: str,
+    years: Iterable[str],
+    state: dict,
+    trade_type: str = "export",
+    cookies=None,
+    concurrency: int = DEFAULT_CONCURRENCY
+) -> Dict[str, Any]:
+    """
+    Synchronous entry point for scrape_all_years; runs it on a fresh event
+    loop with its own client.
+
+    Args:
+        base_url: Base URL of tradestat website
+        user_agent: User-Agent header value
+        hsn: HSN code
+        years: Financial years to scrape
+        state: Dictionary containing CSRF token and other auth state
+        trade_type: "export" or "import"
+        cookies: Cookie jar from the session that produced `state`
+        concurrency: Maximum number of simultaneous requests
+
+    Returns:
+        Consolidated data (see consolidate_years); empty if no year succeeded
+    """
+    async def _main() -> Dict[str, Any]:
+        async with create_async_client(base_url, user_agent, cookies, concurrency) as client:
+            return await scrape_all_years(client, base_url, hsn, years, state, trade_type, concurrency)
+
+    return asyncio.run(_main())
@@ -15,7 +15,6 @@ Usage Examples:
 """
 
 import argparse
-import json
 import os
 import sys
 import time
@@ -25,6 +24,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
 from tradestat_ingestor.core.session import TradeStatSession
+from tradestat_ingestor.core.serialization import dumps_json, write_bytes
 from tradestat_ingestor.scrapers.eidb.commodity_x_country_timeseries import (
     fetch_commodity_country_data,
     get_base_url,
@@ -40,8 +40,7 @@ def save_json(data: dict, filepath: str) -> str:
     """Save data as JSON file."""
     path = Path(filepath)
     path.parent.mkdir(parents=True, exist_ok=True)
-    with open(path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    write_bytes(path, dumps_json(data))
     return str(path.absolute())
 
 
@@ -3,14 +3,16 @@ Storage module for EIDB Commodity x Country Timeseries data.
 Handles saving parsed data to JSON files with proper directory structure.
 """
 
-import json
 import os
 import re
+from functools import lru_cache
 from typing import Dict, Any
 from loguru import logger
 from datetime import datetime
+from tradestat_ingestor.core.serialization import dumps_json, ensure_dir, write_bytes
 
 
+@lru_cache(maxsize=1024)
 def sanitize_filename(name: str) -> str:
     """Sanitize country name for use in filename."""
     # Replace spaces and special characters with underscores
@@ -19,6 +21,12 @@ def sanitize_filename(name: str) -> str:
     return sanitized.upper()
 
 
+@lru_cache(maxsize=64)
+def _dir_for(base_dir: str, trade_type: str) -> str:
+    """Output directory for a (base_dir, trade_type) combination."""
+    return os.path.join(base_dir, "eidb", "commodity_x_country_timeseries", trade_type.lower())
+
+
 def get_output_path(
     base_dir: str,
     trade_type: str,
@@ -46,12 +54,7 @@ def get_output_path(
         Full path to the output JSON file
     """
     # Build path: base_dir/eidb/commodity_x_country_timeseries/{trade_type}/
-    output_dir = os.path.join(
-        base_dir,
-        "eidb",
-        "commodity_x_country_timeseries",
-        trade_type.lower()
-    )
+    output_dir = _dir_for(base_dir, trade_type)
     
     # Filename: hs{code}_{country_code}_{country_name}_{from}-{to}_{value_type}.json
     country_safe = sanitize_filename(country_name)
@@ -94,7 +97,7 @@ def save_timeseries_data(
     )
     
     # Create directory if it doesn't exist
-    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    ensure_dir(os.path.dirname(output_path))
     
     # Add storage metadata
     data["storage"] = {
@@ -105,8 +108,7 @@ def save_timeseries_data(
     }
     
     # Write JSON file
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    write_bytes(output_path, dumps_json(data))
     
     logger.success(f"Saved timeseries data to: {output_path}")
     return output_path
@@ -18,7 +18,7 @@ REGIONS = {
 }
 
 # Available years
-AVAILABLE_YEARS = ["2024", "2023", "2022", "2021", "2020", "2019", "2018"]
+AVAILABLE_YEARS = ("2024", "2023", "2022", "2021", "2020", "2019", "2018")
 
 # Value type mapping
 VALUE_TYPES = {
@@ -3,11 +3,18 @@ Storage module for EIDB Region-wise data.
 Handles saving parsed data to JSON files with proper directory structure.
 """
 
-import json
 import os
+from functools import lru_cache
 from typing import Dict, Any
 from loguru import logger
 from datetime import datetime
+from tradestat_ingestor.core.serialization import dumps_json, ensure_dir, write_bytes
+
+
+@lru_cache(maxsize=256)
+def _dir_for(base_dir: str, trade_type: str, digit_level: int) -> str:
+    """Output directory for a (base_dir, trade_type, digit_level) combination."""
+    return os.path.join(base_dir, "eidb", "region_wise", trade_type.lower(), f"level_{digit_level}")
 
 
 def get_output_path(
@@ -34,13 +41,7 @@ def get_output_path(
     digit_level = len(hscode)
     
     # Build path: base_dir/eidb/region_wise/{trade_type}/level_{digit}/{hscode}_{year}_{value_type}.json
-    output_dir = os.path.join(
-        base_dir,
-        "eidb",
-        "region_wise",
-        trade_type.lower(),
-        f"level_{digit_level}"
-    )
+    output_dir = _dir_for(base_dir, trade_type, digit_level)
     
     filename = f"{hscode}_{year}_{value_type.lower()}.json"
     return os.path.join(output_dir, filename)
@@ -71,7 +72,7 @@ def save_region_wise_data(
     output_path = get_output_path(base_dir, trade_type, hscode, year, value_type)
     
     # Create directory if it doesn't exist
-    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    ensure_dir(os.path.dirname(output_path))
     
     # Add storage metadata
     data["storage"] = {
@@ -82,8 +83,7 @@ def save_region_wise_data(
     }
     
     # Write JSON file
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    write_bytes(output_path, dumps_json(data))
     
     logger.success(f"Saved region-wise data to: {output_path}")
     return output_path
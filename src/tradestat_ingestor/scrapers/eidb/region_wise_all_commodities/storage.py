@@ -3,14 +3,16 @@ Storage module for EIDB Region-wise All Commodities data.
 Handles saving parsed data to JSON files with proper directory structure.
 """
 
-import json
 import os
 import re
+from functools import lru_cache
 from typing import Dict, Any
 from loguru import logger
 from datetime import datetime
+from tradestat_ingestor.core.serialization import dumps_json, ensure_dir, write_bytes
 
 
+@lru_cache(maxsize=1024)
 def sanitize_filename(name: str) -> str:
     """Sanitize country name for use in filename."""
     # Replace spaces and special characters with underscores
@@ -19,6 +21,12 @@ def sanitize_filename(name: str) -> str:
     return sanitized.upper()
 
 
+@lru_cache(maxsize=256)
+def _dir_for(base_dir: str, trade_type: str, digit_level: int) -> str:
+    """Output directory for a (base_dir, trade_type, digit_level) combination."""
+    return os.path.join(base_dir, "eidb", "region_wise_all_commodities", trade_type.lower(), f"level_{digit_level}")
+
+
 def get_output_path(
     base_dir: str,
     trade_type: str,
@@ -44,13 +52,7 @@ def get_output_path(
         Full path to the output JSON file
     """
     # Build path: base_dir/eidb/region_wise_all_commodities/{trade_type}/level_{digit}/
-    output_dir = os.path.join(
-        base_dir,
-        "eidb",
-        "region_wise_all_commodities",
-        trade_type.lower(),
-        f"level_{digit_level}"
-    )
+    output_dir = _dir_for(base_dir, trade_type, digit_level)
     
     # Filename: {country_code}_{country_name}_{year}_{value_type}.json
     country_safe = sanitize_filename(country_name)
@@ -91,7 +93,7 @@ def save_region_wise_all_commodities_data(
     )
     
     # Create directory if it doesn't exist
-    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    ensure_dir(os.path.dirname(output_path))
     
     # Add storage metadata
     data["storage"] = {
@@ -102,8 +104,7 @@ def save_region_wise_all_commodities_data(
     }
     
     # Write JSON file
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    write_bytes(output_path, dumps_json(data))
     
     logger.success(f"Saved region-wise all commodities data to: {output_path}")
     return output_path
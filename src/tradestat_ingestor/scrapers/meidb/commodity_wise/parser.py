@@ -9,13 +9,7 @@ from typing import Dict, List, Any, Optional
 from bs4 import BeautifulSoup
 from loguru import logger
 from datetime import datetime
-
-# Month mapping
-MONTHS = {
-    1: "January", 2: "February", 3: "March", 4: "April",
-    5: "May", 6: "June", 7: "July", 8: "August",
-    9: "September", 10: "October", 11: "November", 12: "December"
-}
+from tradestat_ingestor.scrapers.meidb.constants import MONTHS, VALUE_LABELS
 
 
 def parse_meidb_commodity_wise_html(
@@ -65,13 +59,6 @@ def parse_meidb_commodity_wise_html(
         data_completeness = (records_with_data / total_records * 100) if total_records > 0 else 0
         extract_duration = (datetime.now() - extract_start).total_seconds()
 
-        # Value type labels
-        value_labels = {
-            "usd": "US $ Million",
-            "inr": "₹ Crore",
-            "quantity": "Quantity"
-        }
-
         # Determine digit level
         if hscode.startswith("all_"):
             digit_level = int(hscode.split("_")[1].replace("digit", ""))
@@ -100,7 +87,7 @@ def parse_meidb_commodity_wise_html(
                     "period": f"{month_name} {year}",
                     "trade_type": trade_type,
                     "value_type": value_type,
-                    "value_unit": value_labels.get(value_type, "US $ Million"),
+                    "value_unit": VALUE_LABELS.get(value_type, "US $ Million"),
                     "year_type": year_type,
                     "source_url": f"https://tradestat.commerce.gov.in/meidb/commoditywise_{trade_type}",
                     "report_date": report_date,
@@ -34,7 +34,7 @@ from tradestat_ingestor.config.settings import settings
 
 
 # Available years for scraping (based on data availability: Jan 2018 to Nov 2025)
-AVAILABLE_YEARS = list(range(2018, 2026))
+AVAILABLE_YEARS = tuple(range(2018, 2026))
 
 
 def main():
@@ -104,6 +104,11 @@ def main():
         "--output",
         help="Custom output directory (optional)"
     )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Rewrite output files even if their content is unchanged"
+    )
 
     args = parser.parse_args()
 
@@ -201,7 +206,8 @@ def main():
                         args.month,
                         args.year,
                         args.type,
-                        args.value_type
+                        args.value_type,
+                        force=args.force
                     )
                 else:
                     filepath = save_meidb_all_commodities_data(
@@ -210,7 +216,8 @@ def main():
                         args.month,
                         args.year,
                         args.type,
-                        args.value_type
+                        args.value_type,
+                        force=args.force
                     )
 
                 print(f"[+] Saved to: {filepath}")
@@ -4,6 +4,7 @@ MEIDB Commodity-wise scraper: fetches monthly data for all/specific HS codes at
 
 from loguru import logger
 from typing import Optional
+from tradestat_ingestor.scrapers.meidb.constants import MONTHS
 
 # URL paths for MEIDB commodity-wise reports
 COMMODITY_WISE_EXPORT_PATH = "/meidb/commoditywise_export"
@@ -28,13 +29,6 @@ IMPORT_FIELDS = {
     'year_type': 'imddReportYear',
 }
 
-# Month mapping
-MONTHS = {
-    1: "January", 2: "February", 3: "March", 4: "April",
-    5: "May", 6: "June", 7: "July", 8: "August",
-    9: "September", 10: "October", 11: "November", 12: "December"
-}
-
 
 def scrape_meidb_commodity_wise(
     session,
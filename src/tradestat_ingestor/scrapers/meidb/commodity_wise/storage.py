@@ -3,22 +3,30 @@ Storage utilities for MEIDB commodity-wise monthly data.
 Handles saving scraped data to JSON files.
 """
 
-import json
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any
 from loguru import logger
 from datetime import datetime
+from tradestat_ingestor.core.serialization import ensure_dir, write_json_if_changed
+from tradestat_ingestor.scrapers.meidb.constants import MONTH_ABBR
 
-# Month abbreviations for filenames
-MONTH_ABBR = {
-    1: "jan", 2: "feb", 3: "mar", 4: "apr",
-    5: "may", 6: "jun", 7: "jul", 8: "aug",
-    9: "sep", 10: "oct", 11: "nov", 12: "dec"
-}
+
+@lru_cache(maxsize=16)
+def _dir_for(trade_type: str, digit_level: int = None) -> Path:
+    """Output directory path for a (trade_type, digit_level) combination."""
+    data_root = Path(__file__).parent.parent.parent.parent.parent / "data"
+    output_dir = data_root / "raw" / "meidb" / "commodity_wise" / trade_type
+    
+    # Add level subdirectory if digit_level is provided
+    if digit_level is not None:
+        output_dir = output_dir / f"level_{digit_level}"
+    
+    return output_dir
 
 
 def get_output_dir(trade_type: str = "export", digit_level: int = None) -> Path:
-    """Get the output directory for MEIDB commodity-wise data.
+    """Get the output directory for MEIDB commodity-wise data, creating it if needed.
     
     Args:
         trade_type: "export" or "import"
@@ -27,14 +35,8 @@ def get_output_dir(trade_type: str = "export", digit_level: int = None) -> Path:
     Returns:
         Path to the output directory
     """
-    data_root = Path(__file__).parent.parent.parent.parent.parent / "data"
-    output_dir = data_root / "raw" / "meidb" / "commodity_wise" / trade_type
-    
-    # Add level subdirectory if digit_level is provided
-    if digit_level is not None:
-        output_dir = output_dir / f"level_{digit_level}"
-    
-    output_dir.mkdir(parents=True, exist_ok=True)
+    output_dir = _dir_for(trade_type, digit_level)
+    ensure_dir(output_dir)
     return output_dir
 
 
@@ -44,7 +46,8 @@ def save_meidb_commodity_wise_data(
     month: int,
     year: int,
     trade_type: str = "export",
-    value_type: str = "usd"
+    value_type: str = "usd",
+    force: bool = False
 ) -> Path:
     """
     Save MEIDB monthly commodity-wise data to a JSON file.
@@ -57,6 +60,7 @@ def save_meidb_commodity_wise_data(
         year: Year
         trade_type: "export" or "import"
         value_type: "usd", "inr", or "quantity"
+        force: Write even if the stored document is unchanged
 
     Returns:
         Path to the saved file
@@ -70,8 +74,9 @@ def save_meidb_commodity_wise_data(
     filename = f"{hscode}_{month_abbr}_{year}_{value_type}.json"
     filepath = output_dir / filename
 
-    with open(filepath, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    if not write_json_if_changed(filepath, data, force):
+        logger.info(f"Data unchanged, skipping write: {filepath}")
+        return filepath
 
     logger.success(f"Saved MEIDB commodity-wise data to: {filepath}")
     return filepath
@@ -83,7 +88,8 @@ def save_meidb_all_commodities_data(
     month: int,
     year: int,
     trade_type: str = "export",
-    value_type: str = "usd"
+    value_type: str = "usd",
+    force: bool = False
 ) -> Path:
     """
     Save all commodities data at a digit level to a JSON file.
@@ -96,6 +102,7 @@ def save_meidb_all_commodities_data(
         year: Year
         trade_type: "export" or "import"
         value_type: "usd", "inr", or "quantity"
+        force: Write even if the stored document is unchanged
 
     Returns:
         Path to the saved file
@@ -107,8 +114,9 @@ def save_meidb_all_commodities_data(
     filename = f"all_{digit_level}digit_{month_abbr}_{year}_{value_type}.json"
     filepath = output_dir / filename
 
-    with open(filepath, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    if not write_json_if_changed(filepath, data, force):
+        logger.info(f"Data unchanged, skipping write: {filepath}")
+        return filepath
 
     logger.success(f"Saved MEIDB all commodities data to: {filepath}")
     return filepath
@@ -4,7 +4,16 @@ Fetches monthly export/import data for a specific HS code across all countries.
 """
 
 from .scraper import scrape_meidb_commodity_wise_all_countries
-from .parser import parse_meidb_commodity_wise_all_countries_html
+from .scraper_async import (
+    scrape_meidb_commodity_wise_all_countries_async,
+    scrape_meidb_commodity_wise_all_countries_batch,
+    scrape_meidb_commodity_wise_all_countries_many,
+    create_async_client
+)
+from .parser import (
+    parse_meidb_commodity_wise_all_countries_html,
+    parse_meidb_commodity_wise_all_countries_many
+)
 from .storage import (
     save_meidb_commodity_wise_all_countries_data,
     get_output_path
@@ -12,7 +21,12 @@ from .storage import (
 
 __all__ = [
     "scrape_meidb_commodity_wise_all_countries",
+    "scrape_meidb_commodity_wise_all_countries_async",
+    "scrape_meidb_commodity_wise_all_countries_batch",
+    "scrape_meidb_commodity_wise_all_countries_many",
+    "create_async_client",
     "parse_meidb_commodity_wise_all_countries_html",
+    "parse_meidb_commodity_wise_all_countries_many",
     "save_meidb_commodity_wise_all_countries_data",
     "get_output_path"
 ]
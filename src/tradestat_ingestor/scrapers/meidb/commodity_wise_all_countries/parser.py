@@ -3,19 +3,59 @@ Parser for MEIDB Commodity-wise All Countries monthly data tables.
 Extracts structured data from HTML responses.
 """
 
+import os
 import re
 import hashlib
-from typing import Dict, List, Any, Optional
-from bs4 import BeautifulSoup
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, List, Any, NamedTuple, Optional, Tuple
+import lxml.html
+from lxml import etree
+from lxml.html import HtmlElement
 from loguru import logger
 from datetime import datetime
-
-# Month mapping
-MONTHS = {
-    1: "January", 2: "February", 3: "March", 4: "April",
-    5: "May", 6: "June", 7: "July", 8: "August",
-    9: "September", 10: "October", 11: "November", 12: "December"
-}
+from tradestat_ingestor.scrapers.meidb.constants import MONTHS, VALUE_LABELS
+
+# Output schema versions. 3.0 drops fields that duplicate other leaves of the
+# document; 2.0 stays the default until downstream consumers opt in.
+SCHEMA_VERSIONS = ("2.0", "3.0")
+DEFAULT_SCHEMA_VERSION = "2.0"
+
+# Precompiled selectors, reused across documents
+_FIRST_TABLE = etree.XPath("(descendant-or-self::table)[1]")
+_ROWS = etree.XPath(".//tr")
+_CELLS = etree.XPath("./td")
+_HEADER_CELLS = etree.XPath("./th|./td")
+
+# Country data rows: at least 5 cells, a numeric S. cell, and no Total/India label
+# in the Country cell. Filtering in XPath keeps header/footer rows out of Python.
+_DATA_ROWS = etree.XPath(
+    ".//tr[count(td) >= 5]"
+    "[string-length(normalize-space(td[1])) > 0]"
+    "[translate(normalize-space(td[1]), '0123456789', '') = '']"
+    "[not(contains(td[2], 'Total') or contains(td[2], 'India'))]"
+)
+
+# Report date patterns, searched against the page text
+_REPORT_DATE_RE = re.compile(r'Report Dated:\s*(\d{1,2}\s+\w+\s+\d{4})')
+_LAST_UPDATED_RE = re.compile(r'Data last updated on:\s*(\d{1,2}/\d{1,2}/\d{4})')
+
+
+class CountryRow(NamedTuple):
+    """One country row of the all-countries table."""
+    sno: int
+    country: str
+    # Same month comparison (Year-over-Year)
+    month_prev_year: Optional[float]
+    month_curr_year: Optional[float]
+    month_yoy_growth_pct: Optional[float]
+    # Cumulative Apr-Month comparison (Year-over-Year)
+    cumulative_prev_year: Optional[float]
+    cumulative_curr_year: Optional[float]
+    cumulative_yoy_growth_pct: Optional[float]
+
+
+# Number of numeric columns following S. and Country
+_VALUE_COLUMNS = len(CountryRow._fields) - 2
 
 
 def parse_meidb_commodity_wise_all_countries_html(
@@ -25,7 +65,8 @@ def parse_meidb_commodity_wise_all_countries_html(
     year: int,
     trade_type: str = "export",
     value_type: str = "usd",
-    year_type: str = "financial"
+    year_type: str = "financial",
+    schema_version: str = DEFAULT_SCHEMA_VERSION
 ) -> Optional[Dict[str, Any]]:
     """
     Parse MEIDB monthly commodity-wise all countries trade data from HTML response.
@@ -38,41 +79,62 @@ def parse_meidb_commodity_wise_all_countries_html(
         trade_type: "export" or "import"
         value_type: "usd", "inr", or "quantity"
         year_type: "financial" or "calendar"
+        schema_version: Output schema, "2.0" (default) or "3.0" (duplicate fields removed)
 
     Returns:
         Parsed data dictionary with comprehensive metadata or None if parsing fails
     """
+    if schema_version not in SCHEMA_VERSIONS:
+        logger.error(f"Unsupported schema_version: {schema_version}. Must be one of {SCHEMA_VERSIONS}")
+        return None
+
     try:
-        soup = BeautifulSoup(html, "lxml")
+        # lxml refuses empty documents; an empty body simply has no data
+        if not html.strip():
+            return _empty_result(
+                hscode, month, year, trade_type, value_type, year_type,
+                None, _extract_commodity_info("", hscode), len(html)
+            )
+
+        root = lxml.html.fromstring(html)
         extract_start = datetime.now()
 
+        # Materialize the page text once for the regex-based helpers
+        page_text = root.text_content()
+
         # Extract report date
-        report_date = _extract_report_date(soup)
+        report_date = _extract_report_date(page_text)
 
         # Extract commodity info
-        commodity_info = _extract_commodity_info(soup, hscode)
+        commodity_info = _extract_commodity_info(page_text, hscode)
 
-        # Extract column headers
-        column_headers = _extract_column_headers(soup)
+        # Locate the data table
+        table = _find_table(root)
 
         # Extract countries data
-        countries = _extract_countries_data(soup, value_type)
+        rows = _extract_countries_data(table, value_type)
 
         # Extract totals
-        totals = _extract_totals(soup, value_type)
+        totals = _extract_totals(table, value_type)
+
+        # Nothing to report: skip building the full document
+        if not rows and not totals:
+            return _empty_result(
+                hscode, month, year, trade_type, value_type, year_type,
+                report_date, commodity_info, len(html)
+            )
+
+        # Extract column headers
+        column_headers = _extract_column_headers(table)
 
         # Calculate data quality metrics
-        total_records = len(countries)
-        records_with_data = sum(1 for c in countries if c.get('month_curr_year') is not None)
+        total_records = len(rows)
+        records_with_data = sum(1 for r in rows if r.month_curr_year is not None)
         data_completeness = (records_with_data / total_records * 100) if total_records > 0 else 0
         extract_duration = (datetime.now() - extract_start).total_seconds()
 
-        # Value type labels
-        value_labels = {
-            "usd": "US $ Million",
-            "inr": "₹ Crore",
-            "quantity": "Quantity"
-        }
+        # Materialize the output records once
+        countries = [r._asdict() for r in rows]
 
         # Build the parsed data for checksum
         parsed_data = {
@@ -81,28 +143,12 @@ def parse_meidb_commodity_wise_all_countries_html(
         }
         checksum = hashlib.md5(str(parsed_data).encode()).hexdigest()
 
-        month_name = MONTHS.get(month, str(month))
-
-        return {
+        result = {
             "metadata": {
-                "extraction": {
-                    "scraped_at": datetime.now().isoformat(),
-                    "feature": "meidb_commodity_wise_all_countries",
-                    "hscode": hscode,
-                    "digit_level": len(hscode),
-                    "month": month,
-                    "month_name": month_name,
-                    "year": year,
-                    "period": f"{month_name} {year}",
-                    "trade_type": trade_type,
-                    "value_type": value_type,
-                    "value_unit": value_labels.get(value_type, "US $ Million"),
-                    "year_type": year_type,
-                    "source_url": f"https://tradestat.commerce.gov.in/meidb/cntcode_cmac_{trade_type}",
-                    "report_date": report_date,
-                    "response_size_bytes": len(html),
-                    "extraction_method": "HTTP_POST_with_CSRF"
-                },
+                "extraction": _extraction_metadata(
+                    hscode, month, year, trade_type, value_type, year_type,
+                    report_date, len(html)
+                ),
                 "data": {
                     "data_source": "DGCI&S (Directorate General of Commercial Intelligence and Statistics)",
                     "data_provider": "Ministry of Commerce and Industry, Government of India",
@@ -113,7 +159,7 @@ def parse_meidb_commodity_wise_all_countries_html(
                     "update_frequency": "Monthly"
                 },
                 "version": {
-                    "schema_version": "2.0",
+                    "schema_version": schema_version,
                     "scraper_version": "1.0",
                     "api_compatibility": "TRADESTAT_2025",
                     "last_schema_update": "2026-02-04"
@@ -138,7 +184,7 @@ def parse_meidb_commodity_wise_all_countries_html(
                 "validation_status": "VALID" if data_completeness >= 70 else "PARTIAL" if data_completeness >= 50 else "INCOMPLETE"
             },
             "schema": {
-                "version": "2.0",
+                "version": schema_version,
                 "parser_version": "1.0",
                 "last_updated": "2026-02-04",
                 "fields": {
@@ -160,7 +206,7 @@ def parse_meidb_commodity_wise_all_countries_html(
                 "processing_timestamp": datetime.now().isoformat(),
                 "data_source": "tradestat.commerce.gov.in",
                 "report_type": "meidb_commodity_wise_all_countries",
-                "extraction_method": "BeautifulSoup_HTML_Parser",
+                "extraction_method": "lxml_HTML_Parser",
                 "environment": "production"
             },
             "data_manifest": {
@@ -187,19 +233,152 @@ def parse_meidb_commodity_wise_all_countries_html(
             }
         }
 
+        if schema_version == "3.0":
+            _drop_duplicate_fields(result)
+
+        return result
+
     except Exception as e:
         logger.error(f"Error parsing MEIDB all countries HTML for HS={hscode}, MONTH={month}/{year}: {e}")
         return None
 
 
-def _extract_report_date(soup: BeautifulSoup) -> Optional[str]:
-    """Extract report date from the page."""
+def parse_meidb_commodity_wise_all_countries_many(
+    htmls: Iterable[Optional[str]],
+    params_list: Iterable[Dict[str, Any]],
+    max_workers: Optional[int] = None
+) -> List[Optional[Dict[str, Any]]]:
+    """
+    Parse many HTML responses in parallel worker processes.
+
+    Args:
+        htmls: HTML responses, e.g. from scrape_meidb_commodity_wise_all_countries_many
+               (None entries are passed through as None)
+        params_list: Keyword dicts with hscode, month, year and optionally
+                     trade_type, value_type, year_type, one per HTML
+                     (the same job dicts used for batch scraping)
+        max_workers: Number of worker processes (default: os.cpu_count())
+
+    Returns:
+        List of parsed data dictionaries (None where scraping or parsing failed),
+        in the same order as `htmls`
+    """
+    tasks = list(zip(htmls, params_list))
+    if not tasks:
+        return []
+
+    with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+        return list(executor.map(_parse_one, tasks, chunksize=8))
+
+
+def _parse_one(task: Tuple[Optional[str], Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """Worker entry point for parse_meidb_commodity_wise_all_countries_many."""
+    html, params = task
+    if html is None:
+        return None
+    return parse_meidb_commodity_wise_all_countries_html(html, **params)
+
+
+def _extraction_metadata(
+    hscode: str,
+    month: int,
+    year: int,
+    trade_type: str,
+    value_type: str,
+    year_type: str,
+    report_date: Optional[str],
+    response_size: int
+) -> Dict[str, Any]:
+    """Build the metadata.extraction block describing the request."""
+    month_name = MONTHS.get(month, str(month))
+    return {
+        "scraped_at": datetime.now().isoformat(),
+        "feature": "meidb_commodity_wise_all_countries",
+        "hscode": hscode,
+        "digit_level": len(hscode),
+        "month": month,
+        "month_name": month_name,
+        "year": year,
+        "period": f"{month_name} {year}",
+        "trade_type": trade_type,
+        "value_type": value_type,
+        "value_unit": VALUE_LABELS.get(value_type, "US $ Million"),
+        "year_type": year_type,
+        "source_url": f"https://tradestat.commerce.gov.in/meidb/cntcode_cmac_{trade_type}",
+        "report_date": report_date,
+        "response_size_bytes": response_size,
+        "extraction_method": "HTTP_POST_with_CSRF"
+    }
+
+
+def _empty_result(
+    hscode: str,
+    month: int,
+    year: int,
+    trade_type: str,
+    value_type: str,
+    year_type: str,
+    report_date: Optional[str],
+    commodity_info: Dict[str, Any],
+    response_size: int
+) -> Dict[str, Any]:
+    """Minimal document for responses without any country or totals rows."""
+    return {
+        "metadata": {
+            "extraction": _extraction_metadata(
+                hscode, month, year, trade_type, value_type, year_type,
+                report_date, response_size
+            )
+        },
+        "commodity": commodity_info,
+        "countries": [],
+        "totals": None,
+        "processing": {
+            "status": "NO_DATA",
+            "errors": [],
+            "warnings": [],
+            "processing_timestamp": datetime.now().isoformat(),
+            "report_type": "meidb_commodity_wise_all_countries"
+        }
+    }
+
+
+def _drop_duplicate_fields(result: Dict[str, Any]) -> None:
+    """
+    Remove leaves that repeat other fields of the document (schema 3.0).
+
+    metadata.extraction stays the single source for the request parameters,
+    data_quality for the record counts and validation status.
+    """
+    result["metadata"]["lineage"].pop("data_source_url", None)  # = metadata.extraction.source_url
+    result["schema"].pop("version", None)  # = metadata.version.schema_version
+    manifest = result["data_manifest"]
+    manifest.pop("records_extracted", None)  # = data_quality.total_records
+    manifest.pop("data_completeness_percent", None)  # = data_quality.extraction_completeness_percent
+    manifest.pop("validation_status", None)  # = data_quality.validation_status
+    audit = result["audit_trail"]
+    audit.pop("scraper_configuration", None)  # = metadata.extraction.*
+    audit.pop("execution_environment", None)  # = processing.environment
+
+
+def _find_table(root: HtmlElement) -> Optional[HtmlElement]:
+    """Return the first <table> element in the document (including root itself)."""
+    tables = _FIRST_TABLE(root)
+    return tables[0] if tables else None
+
+
+def _cell_texts(row: HtmlElement, cells: etree.XPath = _CELLS) -> List[str]:
+    """Return the stripped text of each cell of a row matched by `cells`."""
+    return [cell.text_content().strip() for cell in cells(row)]
+
+
+def _extract_report_date(page_text: str) -> Optional[str]:
+    """Extract report date from the page text."""
     try:
-        text = soup.get_text()
-        match = re.search(r'Report Dated:\s*(\d{1,2}\s+\w+\s+\d{4})', text)
+        match = _REPORT_DATE_RE.search(page_text)
         if match:
             return match.group(1)
-        match = re.search(r'Data last updated on:\s*(\d{1,2}/\d{1,2}/\d{4})', text)
+        match = _LAST_UPDATED_RE.search(page_text)
         if match:
             return match.group(1)
     except Exception:
@@ -207,17 +386,15 @@ def _extract_report_date(soup: BeautifulSoup) -> Optional[str]:
     return None
 
 
-def _extract_commodity_info(soup: BeautifulSoup, hscode: str) -> Dict[str, Any]:
-    """Extract commodity information from HTML."""
+def _extract_commodity_info(page_text: str, hscode: str) -> Dict[str, Any]:
+    """Extract commodity information from the page text."""
     description = ""
     unit = ""
     
     try:
-        text_content = soup.get_text()
-        
         # Pattern: Commodity: HSCODE DESCRIPTION Unit: UNIT
         pattern = rf"Commodity:\s*{hscode}\s+(.*?)\s+Unit:\s*(\w+)"
-        match = re.search(pattern, text_content, re.IGNORECASE | re.DOTALL)
+        match = re.search(pattern, page_text, re.IGNORECASE | re.DOTALL)
         
         if match:
             description = match.group(1).strip().split('\n')[0]
@@ -225,7 +402,7 @@ def _extract_commodity_info(soup: BeautifulSoup, hscode: str) -> Dict[str, Any]:
         
         # Alternative pattern
         if not description:
-            for line in text_content.split('\n'):
+            for line in page_text.split('\n'):
                 if hscode in line and 'Unit' in line:
                     parts = line.split('Unit:')
                     if len(parts) > 1:
@@ -242,22 +419,20 @@ def _extract_commodity_info(soup: BeautifulSoup, hscode: str) -> Dict[str, Any]:
     }
 
 
-def _extract_column_headers(soup: BeautifulSoup) -> List[str]:
+def _extract_column_headers(table: Optional[HtmlElement]) -> List[str]:
     """Extract column headers from table."""
     headers = []
     try:
-        table = soup.find("table")
-        if table:
-            header_row = table.find("tr")
-            if header_row:
-                for th in header_row.find_all(["th", "td"]):
-                    headers.append(th.get_text(strip=True))
+        if table is not None:
+            header_rows = _ROWS(table)
+            if header_rows:
+                headers = _cell_texts(header_rows[0], _HEADER_CELLS)
     except Exception:
         pass
     return headers
 
 
-def _extract_countries_data(soup: BeautifulSoup, value_type: str) -> List[Dict[str, Any]]:
+def _extract_countries_data(table: Optional[HtmlElement], value_type: str) -> List[CountryRow]:
     """
     Extract countries data from the table.
     
@@ -271,83 +446,70 @@ def _extract_countries_data(soup: BeautifulSoup, value_type: str) -> List[Dict[s
     7. Apr-{Month} {CurrYear} (F) - Cumulative current year
     8. % Growth - Cumulative YoY growth
     """
-    countries = []
+    data_rows = []
 
     try:
-        table = soup.find("table")
-        if not table:
+        if table is None:
             logger.warning("No table found in HTML")
-            return countries
+            return []
 
-        rows = table.find_all("tr")
+        # Header, footer and totals rows are filtered out by the selector
+        data_rows = [_cell_texts(row) for row in _DATA_ROWS(table)]
 
-        for row in rows:
-            cells = row.find_all("td")
-            if len(cells) < 5:
-                continue
+    except Exception as e:
+        logger.error(f"Error extracting countries data: {e}")
 
-            # Skip totals row
-            row_text = row.get_text()
-            if "Total" in row_text or "India" in row_text:
-                continue
+    return _parse_rows(data_rows)
 
-            try:
-                sno = cells[0].get_text(strip=True)
-                # Skip if sno is not a number (header or footer rows)
-                if not sno.isdigit():
-                    continue
-
-                # MEIDB All Countries has 8 columns:
-                # S., Country, Month-PrevYear, Month-CurrYear, %Growth, Cumulative-PrevYear, Cumulative-CurrYear, %Growth
-                country_data = {
-                    "sno": int(sno),
-                    "country": cells[1].get_text(strip=True),
-                    # Same month comparison (Year-over-Year)
-                    "month_prev_year": _parse_number(cells[2].get_text(strip=True)) if len(cells) > 2 else None,
-                    "month_curr_year": _parse_number(cells[3].get_text(strip=True)) if len(cells) > 3 else None,
-                    "month_yoy_growth_pct": _parse_number(cells[4].get_text(strip=True)) if len(cells) > 4 else None,
-                    # Cumulative Apr-Month comparison (Year-over-Year)
-                    "cumulative_prev_year": _parse_number(cells[5].get_text(strip=True)) if len(cells) > 5 else None,
-                    "cumulative_curr_year": _parse_number(cells[6].get_text(strip=True)) if len(cells) > 6 else None,
-                    "cumulative_yoy_growth_pct": _parse_number(cells[7].get_text(strip=True)) if len(cells) > 7 else None,
-                }
-                countries.append(country_data)
-            except (IndexError, ValueError) as e:
-                logger.debug(f"Skipping row due to parsing error: {e}")
-                continue
 
-    except Exception as e:
-        logger.error(f"Error extracting countries data: {e}")
+def _parse_rows(data_rows: List[List[str]]) -> List[CountryRow]:
+    """
+    Convert the cell texts of data rows into CountryRow records.
+
+    Works on plain strings only, so the numeric conversion runs as one
+    tight loop after all tree access is finished.
+    """
+    countries = []
+    parse = _parse_number
+    start, end = 2, 2 + _VALUE_COLUMNS
+    padding = [None] * _VALUE_COLUMNS
+
+    for cells in data_rows:
+        try:
+            # MEIDB All Countries has 8 columns:
+            # S., Country, Month-PrevYear, Month-CurrYear, %Growth, Cumulative-PrevYear, Cumulative-CurrYear, %Growth
+            values = [parse(text) for text in cells[start:end]]
+            if len(values) < _VALUE_COLUMNS:
+                values += padding[len(values):]
+            countries.append(CountryRow(int(cells[0]), cells[1], *values))
+        except (IndexError, ValueError) as e:
+            logger.debug(f"Skipping row due to parsing error: {e}")
 
     return countries
 
 
-def _extract_totals(soup: BeautifulSoup, value_type: str) -> Optional[Dict[str, Any]]:
+def _extract_totals(table: Optional[HtmlElement], value_type: str) -> Optional[Dict[str, Any]]:
     """Extract totals row from the table."""
     try:
-        table = soup.find("table")
-        if not table:
+        if table is None:
             return None
 
-        rows = table.find_all("tr")
-
-        for row in rows:
-            cells = row.find_all("td")
+        for row in _ROWS(table):
+            cells = _cell_texts(row)
             if len(cells) < 4:
                 continue
 
-            row_text = row.get_text()
-            if "Total" in row_text:
+            if any("Total" in text for text in cells[:2]):
                 try:
                     return {
                         # Same month comparison (Year-over-Year)
-                        "month_prev_year": _parse_number(cells[2].get_text(strip=True)) if len(cells) > 2 else None,
-                        "month_curr_year": _parse_number(cells[3].get_text(strip=True)) if len(cells) > 3 else None,
-                        "month_yoy_growth_pct": _parse_number(cells[4].get_text(strip=True)) if len(cells) > 4 else None,
+                        "month_prev_year": _parse_number(cells[2]) if len(cells) > 2 else None,
+                        "month_curr_year": _parse_number(cells[3]) if len(cells) > 3 else None,
+                        "month_yoy_growth_pct": _parse_number(cells[4]) if len(cells) > 4 else None,
                         # Cumulative Apr-Month comparison (Year-over-Year)
-                        "cumulative_prev_year": _parse_number(cells[5].get_text(strip=True)) if len(cells) > 5 else None,
-                        "cumulative_curr_year": _parse_number(cells[6].get_text(strip=True)) if len(cells) > 6 else None,
-                        "cumulative_yoy_growth_pct": _parse_number(cells[7].get_text(strip=True)) if len(cells) > 7 else None,
+                        "cumulative_prev_year": _parse_number(cells[5]) if len(cells) > 5 else None,
+                        "cumulative_curr_year": _parse_number(cells[6]) if len(cells) > 6 else None,
+                        "cumulative_yoy_growth_pct": _parse_number(cells[7]) if len(cells) > 7 else None,
                     }
                 except (IndexError, ValueError):
                     pass
@@ -104,6 +104,28 @@ Examples:
         default=str(DEFAULT_OUTPUT_DIR),
         help=f"Output directory (default: {DEFAULT_OUTPUT_DIR})"
     )
+    parser.add_argument(
+        "--cache-dir",
+        type=str,
+        default=None,
+        help="Cache raw responses in this directory and reuse them on re-runs (default: disabled)"
+    )
+    parser.add_argument(
+        "--schema-version",
+        choices=["2.0", "3.0"],
+        default="2.0",
+        help="Output schema: 2.0, or 3.0 without duplicated metadata fields (default: 2.0)"
+    )
+    parser.add_argument(
+        "--compress",
+        action="store_true",
+        help="Write zstd-compressed .json.zst output"
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Rewrite the output file even if its content is unchanged"
+    )
     
     args = parser.parse_args()
     
@@ -149,7 +171,8 @@ Examples:
         trade_type=args.type,
         value_type=args.value_type,
         year_type=args.year_type,
-        state=state
+        state=state,
+        cache_dir=args.cache_dir
     )
     
     if not html:
@@ -166,7 +189,8 @@ Examples:
         year=args.year,
         trade_type=args.type,
         value_type=args.value_type,
-        year_type=args.year_type
+        year_type=args.year_type,
+        schema_version=args.schema_version
     )
     
     if not parsed_data:
@@ -185,7 +209,9 @@ Examples:
         year=args.year,
         trade_type=args.type,
         value_type=args.value_type,
-        year_type=args.year_type
+        year_type=args.year_type,
+        compress=args.compress,
+        force=args.force
     )
     
     if output_path:
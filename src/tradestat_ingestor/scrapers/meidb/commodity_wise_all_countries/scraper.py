@@ -4,7 +4,10 @@ Fetches monthly data for a specific HS code across all countries.
 """
 
 from loguru import logger
-from typing import Optional
+from typing import Dict, Optional, Tuple
+
+from tradestat_ingestor.core.response_cache import response_cache
+from tradestat_ingestor.scrapers.meidb.constants import MONTHS
 
 # URL paths for MEIDB commodity-wise all countries reports
 EXPORT_PATH = "/meidb/commodity_wise_all_countries_export"
@@ -28,14 +31,21 @@ IMPORT_FIELDS = {
     'year_type': 'cwacimReportYear',
 }
 
-# Month mapping
-MONTHS = {
-    1: "January", 2: "February", 3: "March", 4: "April",
-    5: "May", 6: "June", 7: "July", 8: "August",
-    9: "September", 10: "October", 11: "November", 12: "December"
+# Form values for value_type
+_VALUE_MAP = {
+    "usd": "1",      # US $ Million
+    "inr": "2",      # ₹ Crore
+    "quantity": "3"  # Quantity
+}
+
+# Form values for year_type
+_YEAR_TYPE_MAP = {
+    "financial": "1",
+    "calendar": "2"
 }
 
 
+@response_cache(("hscode", "month", "year", "trade_type", "value_type", "year_type"))
 def scrape_meidb_commodity_wise_all_countries(
     session,
     base_url: str,
@@ -60,10 +70,51 @@ def scrape_meidb_commodity_wise_all_countries(
         value_type: "usd" (US $ Million), "inr" (₹ Crore), or "quantity"
         year_type: "financial" or "calendar"
         state: Dictionary containing CSRF token and other auth state
+        cache_dir: (keyword-only, added by @response_cache) directory for cached
+                   responses; caching is disabled when omitted
 
     Returns:
         HTML response as string, or None if request fails
     """
+    request = _build_request(hscode, month, year, trade_type, value_type, year_type, state)
+    if request is None:
+        return None
+    path, payload = request
+
+    month_name = MONTHS.get(month, str(month))
+    logger.info(f"Scraping MEIDB commodity-wise all countries {trade_type}: HS={hscode}, MONTH={month_name} {year}, VALUE_TYPE={value_type}")
+
+    try:
+        resp = session.post(
+            base_url + path,
+            data=payload,
+            timeout=120,  # Longer timeout for country data
+        )
+        resp.raise_for_status()
+        logger.success(f"MEIDB commodity-wise all countries {trade_type} scrape successful: HS={hscode}, MONTH={month_name} {year}")
+        return resp.text
+    except Exception as e:
+        logger.error(f"MEIDB commodity-wise all countries {trade_type} scrape failed: HS={hscode}, MONTH={month_name} {year}, Error: {e}")
+        return None
+
+
+def _build_request(
+    hscode: str,
+    month: int,
+    year: int,
+    trade_type: str,
+    value_type: str,
+    year_type: str,
+    state: dict
+) -> Optional[Tuple[str, Dict[str, str]]]:
+    """
+    Validate the request parameters and build the URL path and form payload.
+
+    Shared by the sync and async scrapers so both submit identical forms.
+
+    Returns:
+        (path, payload) tuple, or None if the parameters are invalid
+    """
     # Validate month
     if month < 1 or month > 12:
         logger.error(f"Invalid month: {month}. Must be 1-12")
@@ -80,20 +131,9 @@ def scrape_meidb_commodity_wise_all_countries(
         logger.error(f"Invalid trade_type: {trade_type}. Must be 'export' or 'import'")
         return None
 
-    # Map value_type to form value
-    value_map = {
-        "usd": "1",      # US $ Million
-        "inr": "2",      # ₹ Crore
-        "quantity": "3"  # Quantity
-    }
-    report_value = value_map.get(value_type.lower(), "1")
-
-    # Map year_type to form value
-    year_type_map = {
-        "financial": "1",
-        "calendar": "2"
-    }
-    report_year = year_type_map.get(year_type.lower(), "1")
+    # Map value_type / year_type to form values
+    report_value = _VALUE_MAP.get(value_type.lower(), "1")
+    report_year = _YEAR_TYPE_MAP.get(year_type.lower(), "1")
 
     # Validate: quantity only available at 8-digit level
     if value_type.lower() == "quantity" and len(hscode) != 8:
@@ -110,18 +150,4 @@ def scrape_meidb_commodity_wise_all_countries(
         fields['year_type']: report_year,
     }
 
-    month_name = MONTHS.get(month, str(month))
-    logger.info(f"Scraping MEIDB commodity-wise all countries {trade_type}: HS={hscode}, MONTH={month_name} {year}, VALUE_TYPE={value_type}")
-
-    try:
-        resp = session.post(
-            base_url + path,
-            data=payload,
-            timeout=120,  # Longer timeout for country data
-        )
-        resp.raise_for_status()
-        logger.success(f"MEIDB commodity-wise all countries {trade_type} scrape successful: HS={hscode}, MONTH={month_name} {year}")
-        return resp.text
-    except Exception as e:
-        logger.error(f"MEIDB commodity-wise all countries {trade_type} scrape failed: HS={hscode}, MONTH={month_name} {year}, Error: {e}")
-        return None
+    return path, payload
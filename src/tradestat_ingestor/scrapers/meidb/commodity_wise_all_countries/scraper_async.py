@@ -0,0 +1,130 @@
+"""
+Async MEIDB Commodity-wise All Countries scraper.
+Fetches many (hscode, month, year) reports concurrently over one HTTP/2 client.
+"""
+
+import asyncio
+from loguru import logger
+from typing import Any, Dict, Iterable, List, Optional
+
+import httpx
+
+from tradestat_ingestor.core.session import create_async_client
+from .scraper import MONTHS, _build_request
+
+# Maximum number of in-flight POSTs per batch
+DEFAULT_CONCURRENCY = 32
+
+
+async def scrape_meidb_commodity_wise_all_countries_async(
+    client: httpx.AsyncClient,
+    base_url: str,
+    hscode: str,
+    month: int,
+    year: int,
+    trade_type: str = "export",
+    value_type: str = "usd",
+    year_type: str = "financial",
+    state: dict = None
+) -> Optional[str]:
+    """
+    Async variant of scrape_meidb_commodity_wise_all_countries.
+
+    Args:
+        client: httpx.AsyncClient sharing cookies with the bootstrapped session
+        base_url: Base URL of tradestat website
+        hscode: HS code (2, 4, 6, or 8 digit)
+        month: Month (1-12)
+        year: Year (e.g., 2024, 2025)
+        trade_type: "export" or "import"
+        value_type: "usd" (US $ Million), "inr" (₹ Crore), or "quantity"
+        year_type: "financial" or "calendar"
+        state: Dictionary containing CSRF token and other auth state
+
+    Returns:
+        HTML response as string, or None if request fails
+    """
+    request = _build_request(hscode, month, year, trade_type, value_type, year_type, state)
+    if request is None:
+        return None
+    path, payload = request
+
+    month_name = MONTHS.get(month, str(month))
+    logger.info(f"Scraping MEIDB commodity-wise all countries {trade_type}: HS={hscode}, MONTH={month_name} {year}, VALUE_TYPE={value_type}")
+
+    try:
+        resp = await client.post(
+            base_url + path,
+            data=payload,
+            timeout=120,  # Longer timeout for country data
+        )
+        resp.raise_for_status()
+        logger.success(f"MEIDB commodity-wise all countries {trade_type} scrape successful: HS={hscode}, MONTH={month_name} {year}")
+        return resp.text
+    except Exception as e:
+        logger.error(f"MEIDB commodity-wise all countries {trade_type} scrape failed: HS={hscode}, MONTH={month_name} {year}, Error: {e}")
+        return None
+
+
+async def scrape_meidb_commodity_wise_all_countries_batch(
+    client: httpx.AsyncClient,
+    base_url: str,
+    jobs: Iterable[Dict[str, Any]],
+    state: dict,
+    concurrency: int = DEFAULT_CONCURRENCY
+) -> List[Optional[str]]:
+    """
+    Scrape many reports concurrently, at most `concurrency` requests in flight.
+
+    Args:
+        client: httpx.AsyncClient sharing cookies with the bootstrapped session
+        base_url: Base URL of tradestat website
+        jobs: Iterable of keyword dicts with hscode, month, year and optionally
+              trade_type, value_type, year_type
+        state: Dictionary containing CSRF token and other auth state
+        concurrency: Maximum number of simultaneous requests
+
+    Returns:
+        List of HTML responses (None for failed requests), in the same order as `jobs`
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _run(job: Dict[str, Any]) -> Optional[str]:
+        async with semaphore:
+            return await scrape_meidb_commodity_wise_all_countries_async(
+                client, base_url, state=state, **job
+            )
+
+    return await asyncio.gather(*(_run(job) for job in jobs))
+
+
+def scrape_meidb_commodity_wise_all_countries_many(
+    base_url: str,
+    user_agent: str,
+    jobs: Iterable[Dict[str, Any]],
+    state: dict,
+    cookies=None,
+    concurrency: int = DEFAULT_CONCURRENCY
+) -> List[Optional[str]]:
+    """
+    Synchronous entry point for batch scraping; runs the async batch driver
+    on a fresh event loop with its own client.
+
+    Args:
+        base_url: Base URL of tradestat website
+        user_agent: User-Agent header value
+        jobs: Iterable of keyword dicts (see scrape_meidb_commodity_wise_all_countries_batch)
+        state: Dictionary containing CSRF token and other auth state
+        cookies: Cookie jar from the session that produced `state`
+        concurrency: Maximum number of simultaneous requests
+
+    Returns:
+        List of HTML responses (None for failed requests), in the same order as `jobs`
+    """
+    async def _main() -> List[Optional[str]]:
+        async with create_async_client(base_url, user_agent, cookies, concurrency) as client:
+            return await scrape_meidb_commodity_wise_all_countries_batch(
+                client, base_url, jobs, state, concurrency
+            )
+
+    return asyncio.run(_main())
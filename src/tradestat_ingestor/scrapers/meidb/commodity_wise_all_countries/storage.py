@@ -3,18 +3,18 @@ Storage utilities for MEIDB commodity-wise all countries data.
 Handles saving parsed data to JSON files with proper directory structure.
 """
 
-import json
-import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any, Optional
 from loguru import logger
+from tradestat_ingestor.core.serialization import ensure_dir, write_json_if_changed
+from tradestat_ingestor.scrapers.meidb.constants import MONTH_ABBR as MONTH_SHORT
 
-# Month short names for filenames
-MONTH_SHORT = {
-    1: "jan", 2: "feb", 3: "mar", 4: "apr",
-    5: "may", 6: "jun", 7: "jul", 8: "aug",
-    9: "sep", 10: "oct", 11: "nov", 12: "dec"
-}
+
+@lru_cache(maxsize=256)
+def _dir_for(base_dir: str, trade_type: str, digit_level: int) -> Path:
+    """Output directory for a (base_dir, trade_type, digit_level) combination."""
+    return Path(base_dir) / "meidb" / "commodity_wise_all_countries" / trade_type / f"level_{digit_level}"
 
 
 def get_output_path(
@@ -24,7 +24,8 @@ def get_output_path(
     year: int,
     trade_type: str = "export",
     value_type: str = "usd",
-    year_type: str = "financial"
+    year_type: str = "financial",
+    compress: bool = False
 ) -> Path:
     """
     Generate output path for the JSON file.
@@ -32,6 +33,8 @@ def get_output_path(
     Structure: base_dir/meidb/commodity_wise_all_countries/{trade_type}/level_{digit}/{hscode}_{month}_{year}_{value_type}.json
     
     Example: src/data/raw/meidb/commodity_wise_all_countries/export/level_8/85171300_nov_2025_usd.json
+    
+    With compress=True the file extension is .json.zst.
     """
     digit_level = len(hscode)
     month_short = MONTH_SHORT.get(month, str(month).zfill(2))
@@ -42,7 +45,10 @@ def get_output_path(
     else:
         filename = f"{hscode}_{month_short}_{year}_{value_type}.json"
     
-    output_path = Path(base_dir) / "meidb" / "commodity_wise_all_countries" / trade_type / f"level_{digit_level}" / filename
+    if compress:
+        filename += ".zst"
+    
+    output_path = _dir_for(str(base_dir), trade_type, digit_level) / filename
     
     return output_path
 
@@ -55,7 +61,9 @@ def save_meidb_commodity_wise_all_countries_data(
     year: int,
     trade_type: str = "export",
     value_type: str = "usd",
-    year_type: str = "financial"
+    year_type: str = "financial",
+    compress: bool = False,
+    force: bool = False
 ) -> Optional[str]:
     """
     Save parsed MEIDB commodity-wise all countries data to a JSON file.
@@ -69,21 +77,25 @@ def save_meidb_commodity_wise_all_countries_data(
         trade_type: "export" or "import"
         value_type: "usd", "inr", or "quantity"
         year_type: "financial" or "calendar"
+        compress: Write zstd-compressed .json.zst instead of plain JSON
+        force: Write even if the stored document is unchanged
         
     Returns:
         Path to saved file, or None if save failed
     """
     try:
         output_path = get_output_path(
-            base_dir, hscode, month, year, trade_type, value_type, year_type
+            base_dir, hscode, month, year, trade_type, value_type, year_type, compress
         )
         
         # Create directory if it doesn't exist
-        output_path.parent.mkdir(parents=True, exist_ok=True)
+        ensure_dir(output_path.parent)
         
-        # Save JSON with pretty formatting
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        # Encode once and write the whole document in a single buffer,
+        # skipping the write when the stored document is unchanged
+        if not write_json_if_changed(output_path, data, force, compress):
+            logger.info(f"Data unchanged, skipping write: {output_path}")
+            return str(output_path)
         
         logger.success(f"Saved MEIDB commodity-wise all countries data to: {output_path}")
         return str(output_path)
@@ -0,0 +1,27 @@
+"""
+Constants shared by the MEIDB scrapers.
+"""
+
+# Month number -> full name, as shown in MEIDB reports
+MONTHS = {
+    1: "January", 2: "February", 3: "March", 4: "April",
+    5: "May", 6: "June", 7: "July", 8: "August",
+    9: "September", 10: "October", 11: "November", 12: "December"
+}
+
+# Month number -> lowercase abbreviation, used in output filenames
+MONTH_ABBR = {
+    1: "jan", 2: "feb", 3: "mar", 4: "apr",
+    5: "may", 6: "jun", 7: "jul", 8: "aug",
+    9: "sep", 10: "oct", 11: "nov", 12: "dec"
+}
+
+# value_type -> unit label written to output metadata
+VALUE_LABELS = {
+    "usd": "US $ Million",
+    "inr": "₹ Crore",
+    "quantity": "Quantity"
+}
+
+# Principal commodity reports state quantities in thousands
+VALUE_UNITS = {**VALUE_LABELS, "quantity": "Quantity in thousands"}
@@ -3,8 +3,22 @@ MEIDB Principal Commodity-wise All HSCode scraper.
 Fetches all HSCode breakdowns for a given principal commodity from MEIDB.
 """
 
-from .scraper import scrape_meidb_principal_commodity_wise_all_hscode, PRINCIPAL_COMMODITIES, get_commodity_name
-from .parser import parse_meidb_principal_commodity_wise_all_hscode_html
+from .scraper import (
+    scrape_meidb_principal_commodity_wise_all_hscode,
+    scrape_meidb_principal_commodity_wise_all_hscode_many,
+    scrape_meidb_principal_commodity_wise_all_hscode_stream,
+    PRINCIPAL_COMMODITIES,
+    get_commodity_name
+)
+from .scraper_async import (
+    scrape_meidb_principal_commodity_wise_all_hscode_async,
+    scrape_meidb_principal_commodity_wise_all_hscode_batch,
+    scrape_meidb_principal_commodity_wise_all_hscode_concurrent
+)
+from .parser import (
+    parse_meidb_principal_commodity_wise_all_hscode_html,
+    parse_meidb_principal_commodity_wise_all_hscode_stream
+)
 from .storage import (
     save_meidb_principal_commodity_wise_all_hscode_data,
     get_output_path
@@ -12,7 +26,13 @@ from .storage import (
 
 __all__ = [
     "scrape_meidb_principal_commodity_wise_all_hscode",
+    "scrape_meidb_principal_commodity_wise_all_hscode_many",
+    "scrape_meidb_principal_commodity_wise_all_hscode_stream",
+    "scrape_meidb_principal_commodity_wise_all_hscode_async",
+    "scrape_meidb_principal_commodity_wise_all_hscode_batch",
+    "scrape_meidb_principal_commodity_wise_all_hscode_concurrent",
     "parse_meidb_principal_commodity_wise_all_hscode_html",
+    "parse_meidb_principal_commodity_wise_all_hscode_stream",
     "save_meidb_principal_commodity_wise_all_hscode_data",
     "get_output_path",
     "PRINCIPAL_COMMODITIES",
@@ -2,22 +2,66 @@
 Parser for MEIDB Principal Commodity-wise All HSCode data.
 """
 
-from typing import Dict, List, Any, Optional
-from bs4 import BeautifulSoup
+import codecs
+from typing import Dict, Iterable, Iterator, List, Any, Optional, Tuple
+import lxml.html
+from lxml import etree
+from lxml.html import HtmlElement
 from loguru import logger
 from datetime import datetime
+from html import unescape
 import re
+from tradestat_ingestor.scrapers.meidb.constants import MONTHS, VALUE_UNITS
 
-MONTHS = {
-    1: "January", 2: "February", 3: "March", 4: "April",
-    5: "May", 6: "June", 7: "July", 8: "August",
-    9: "September", 10: "October", 11: "November", 12: "December"
-}
+# Thousands separators and whitespace dropped before float conversion
+_NUM_TRANS = str.maketrans("", "", ", \t\n\r\xa0")
+# Placeholders the site uses for missing values
+_EMPTY = frozenset({"", "-", "--", "NA", "N.A."})
+# Joins cell strings for batch conversion; never occurs in page text
+_BATCH_SEP = "\x1f"
+
+# Numeric columns (cells 3-8) of commodity and total rows, in output order
+_VALUE_FIELDS = (
+    "month_prev_year",
+    "month_curr_year",
+    "month_yoy_growth_pct",
+    "cumulative_prev_year",
+    "cumulative_curr_year",
+    "cumulative_yoy_growth_pct",
+)
+_VALUE_COLUMNS = len(_VALUE_FIELDS)
+
+# The report date sits in the page header, ahead of the data table
+_REPORT_DATE_RE = re.compile(r"Report Dated?:?\s*(\d{2}\s+\w+\s+\d{4})")
+_TABLE_START_RE = re.compile(r"<table\b", re.IGNORECASE)
+_TABLE_END_RE = re.compile(r"</table\s*>", re.IGNORECASE)
+_TAG_RE = re.compile(r"<[^>]+>")
 
-VALUE_UNITS = {
-    "usd": "US $ Million",
-    "inr": "₹ Crore",
-    "quantity": "Quantity in thousands"
+# Precompiled selectors, reused across rows and documents
+_CELLS = etree.XPath("./td")
+_HEADER_CELLS = etree.XPath("./th|./td")
+
+_SOURCE_URL_PREFIX = "https://tradestat.commerce.gov.in/meidb/principal_commodity_wise_all_HSCode_"
+
+# Static metadata sections, shared by every parsed document (treat as read-only)
+_DATA_META = {
+    "data_source": "DGCI&S (Directorate General of Commercial Intelligence and Statistics)",
+    "data_provider": "Ministry of Commerce and Industry, Government of India",
+    "data_classification": "PUBLIC",
+    "data_category": "Trade_Statistics",
+    "temporal_granularity": "Monthly",
+    "geographic_coverage": "India",
+    "update_frequency": "Monthly"
+}
+_VERSION_META = {
+    "schema_version": "2.0",
+    "scraper_version": "1.0",
+    "api_compatibility": "TRADESTAT_2025"
+}
+_LINEAGE_META = {
+    "extraction_point": "meidb_principal_commodity_wise_all_hscode",
+    "processing_chain": ["scrape_html", "parse_html", "extract_table", "validate_data"],
+    "transformations_applied": ["HTML_to_JSON", "Value_Normalization", "Missing_Data_Handling"]
 }
 
 
@@ -48,180 +92,313 @@ def parse_meidb_principal_commodity_wise_all_hscode_html(
         Parsed data dictionary or None if parsing fails
     """
     try:
-        soup = BeautifulSoup(html, "lxml")
+        # lxml refuses empty documents; an empty body simply has no data
+        table = _find_table(_parse_table_region(html)) if html.strip() else None
+        
+        # Extract column headers, commodity details (HSCode wise breakdown)
+        # and the total row in one pass over the table
+        if table is None:
+            column_headers, commodities, total = [], [], None
+        else:
+            column_headers, commodities, total = _extract_rows(table.iter("tr"))
         
-        # Extract column headers
-        column_headers = _extract_column_headers(soup)
+        # Extract report date if available
+        report_date = _extract_report_date(html)
         
-        # Extract commodity details (HSCode wise breakdown)
-        commodities = _extract_commodities(soup)
+        return _build_result(
+            column_headers, commodities, total, report_date, len(html),
+            commodity_code, commodity_name, month, year, trade_type, value_type, year_type
+        )
+    except Exception as e:
+        logger.error(f"Error parsing principal commodity data: {e}")
+        return None
+
+
+def parse_meidb_principal_commodity_wise_all_hscode_stream(
+    chunks: Iterable[bytes],
+    commodity_code: str,
+    commodity_name: str,
+    month: int,
+    year: int,
+    trade_type: str,
+    value_type: str,
+    year_type: str,
+    encoding: Optional[str] = None
+) -> Optional[Dict[str, Any]]:
+    """
+    Parse a principal commodity response incrementally as it is downloaded.
+
+    Feeds raw chunks (e.g. from scrape_meidb_principal_commodity_wise_all_hscode_stream)
+    to an lxml pull parser and converts each table row as soon as it is
+    complete, discarding it afterwards, so neither the full response text nor
+    the full tree is held in memory. Produces the same document as
+    parse_meidb_principal_commodity_wise_all_hscode_html.
+
+    Args:
+        chunks: Iterable of raw response byte chunks
+        commodity_code: Principal commodity code (e.g., A1)
+        commodity_name: Principal commodity name (e.g., TEA)
+        month: Month (1-12)
+        year: Year
+        trade_type: "export" or "import"
+        value_type: "usd", "inr", or "quantity"
+        year_type: "financial" or "calendar"
+        encoding: Response encoding, if known (otherwise detected by lxml)
+
+    Returns:
+        Parsed data dictionary or None if parsing fails
+    """
+    try:
+        parser = etree.HTMLPullParser(events=("start", "end"), tag=("tr", "table"), encoding=encoding)
+        parser.set_element_class_lookup(lxml.html.HtmlElementClassLookup())
+        size = [0]
         
-        # Extract total row
-        total = _extract_total(soup)
+        rows = _stream_rows(chunks, parser, size, encoding)
+        column_headers, commodities, total = _extract_rows(rows)
+        # Feed the rest of the response (footer, report date) and close it
+        for _ in rows:
+            pass
         
-        # Extract report date if available
-        report_date = _extract_report_date(soup)
+        # Rows have been dropped from the tree, so what remains is the page chrome.
+        # An empty body (no chunks, or only whitespace) leaves no tree at all.
+        root = parser.close() if size[0] else None
+        match = _REPORT_DATE_RE.search(root.text_content()) if root is not None else None
+        report_date = match.group(1) if match else None
         
-        return {
-            "metadata": {
-                "extraction": {
-                    "scraped_at": datetime.now().isoformat(),
-                    "feature": "meidb_principal_commodity_wise_all_hscode",
-                    "principal_commodity_code": commodity_code,
-                    "principal_commodity_name": commodity_name,
-                    "month": month,
-                    "month_name": MONTHS.get(month),
-                    "year": year,
-                    "period": f"{MONTHS.get(month)} {year}",
-                    "trade_type": trade_type,
-                    "value_type": value_type,
-                    "value_unit": VALUE_UNITS.get(value_type.lower(), "US $ Million"),
-                    "year_type": year_type,
-                    "source_url": f"https://tradestat.commerce.gov.in/meidb/principal_commodity_wise_all_HSCode_{trade_type}",
-                    "report_date": report_date,
-                    "response_size_bytes": len(html),
-                    "extraction_method": "HTTP_POST_with_CSRF"
-                },
-                "data": {
-                    "data_source": "DGCI&S (Directorate General of Commercial Intelligence and Statistics)",
-                    "data_provider": "Ministry of Commerce and Industry, Government of India",
-                    "data_classification": "PUBLIC",
-                    "data_category": "Trade_Statistics",
-                    "temporal_granularity": "Monthly",
-                    "geographic_coverage": "India",
-                    "update_frequency": "Monthly"
-                },
-                "version": {
-                    "schema_version": "2.0",
-                    "scraper_version": "1.0",
-                    "api_compatibility": "TRADESTAT_2025",
-                    "last_schema_update": datetime.now().strftime("%Y-%m-%d")
-                },
-                "lineage": {
-                    "data_source_url": f"https://tradestat.commerce.gov.in/meidb/principal_commodity_wise_all_HSCode_{trade_type}",
-                    "extraction_point": "meidb_principal_commodity_wise_all_hscode",
-                    "processing_chain": ["scrape_html", "parse_html", "extract_table", "validate_data"],
-                    "transformations_applied": ["HTML_to_JSON", "Value_Normalization", "Missing_Data_Handling"]
-                }
-            },
-            "principal_commodity": {
-                "code": commodity_code,
-                "name": commodity_name
-            },
-            "column_headers": column_headers,
-            "commodities": commodities,
-            "total": total,
-            "data_quality": {
-                "total_hscodes": len(commodities),
-                "has_total": total is not None
-            }
-        }
+        return _build_result(
+            column_headers, commodities, total, report_date, size[0],
+            commodity_code, commodity_name, month, year, trade_type, value_type, year_type
+        )
     except Exception as e:
         logger.error(f"Error parsing principal commodity data: {e}")
         return None
 
 
-def _extract_column_headers(soup: BeautifulSoup) -> List[str]:
-    """Extract column headers from the table."""
-    headers = []
-    table = soup.find("table")
-    if not table:
-        return headers
+def _stream_rows(chunks: Iterable[bytes], parser, size: List[int], encoding: Optional[str] = None) -> Iterator[HtmlElement]:
+    """
+    Feed `chunks` to `parser` and yield each <tr> of the first table once it is
+    complete, removing it from the tree after the consumer is done with it.
+    Rows of tables nested in the first table are yielded after the row that
+    contains them, in the same order as table.iter("tr"). Keeps consuming the
+    rest of the response (for the report date); the decoded character count,
+    as len(html) would give, is accumulated in size[0].
+    """
+    decoder = codecs.getincrementaldecoder(encoding or "utf-8")(errors="replace")
+    depth = 0
+    first_table_done = False
+    for chunk in chunks:
+        size[0] += len(decoder.decode(chunk))
+        parser.feed(chunk)
+        for event, element in parser.read_events():
+            if element.tag == "table":
+                if first_table_done:
+                    continue
+                if event == "start":
+                    depth += 1
+                else:
+                    depth -= 1
+                    first_table_done = depth == 0
+                continue
+            # Nested rows stay in the tree until their outer row is complete
+            if event == "start" or depth > 1:
+                continue
+            if depth == 1 and not first_table_done:
+                yield from element.iter("tr")
+            element.clear(keep_tail=True)
+            parent = element.getparent()
+            while element.getprevious() is not None:
+                del parent[0]
+    size[0] += len(decoder.decode(b"", final=True))
+
+
+def _build_result(
+    column_headers: List[str],
+    commodities: List[Dict[str, Any]],
+    total: Optional[Dict[str, Any]],
+    report_date: Optional[str],
+    response_size: int,
+    commodity_code: str,
+    commodity_name: str,
+    month: int,
+    year: int,
+    trade_type: str,
+    value_type: str,
+    year_type: str
+) -> Dict[str, Any]:
+    """Assemble the output document from the extracted table data."""
+    now = datetime.now()
+    month_name = MONTHS.get(month)
+    source_url = f"{_SOURCE_URL_PREFIX}{trade_type}"
     
-    header_row = table.find("tr")
-    if header_row:
-        for th in header_row.find_all(["th", "td"]):
-            headers.append(th.get_text(strip=True))
-    return headers
+    return {
+        "metadata": {
+            "extraction": {
+                "scraped_at": now.isoformat(),
+                "feature": "meidb_principal_commodity_wise_all_hscode",
+                "principal_commodity_code": commodity_code,
+                "principal_commodity_name": commodity_name,
+                "month": month,
+                "month_name": month_name,
+                "year": year,
+                "period": f"{month_name} {year}",
+                "trade_type": trade_type,
+                "value_type": value_type,
+                "value_unit": VALUE_UNITS.get(value_type.lower(), "US $ Million"),
+                "year_type": year_type,
+                "source_url": source_url,
+                "report_date": report_date,
+                "response_size_bytes": response_size,
+                "extraction_method": "HTTP_POST_with_CSRF"
+            },
+            "data": _DATA_META,
+            "version": {**_VERSION_META, "last_schema_update": now.strftime("%Y-%m-%d")},
+            "lineage": {"data_source_url": source_url, **_LINEAGE_META}
+        },
+        "principal_commodity": {
+            "code": commodity_code,
+            "name": commodity_name
+        },
+        "column_headers": column_headers,
+        "commodities": commodities,
+        "total": total,
+        "data_quality": {
+            "total_hscodes": len(commodities),
+            "has_total": total is not None
+        }
+    }
+
+
+def _parse_table_region(html: str) -> HtmlElement:
+    """
+    Parse only the data table out of the page.
+
+    The table is cut out of the raw markup between the first <table> and its
+    closing tag, so navigation, scripts and footers never become tree nodes.
+    Falls back to parsing the whole document when the markers are missing or
+    the table contains a nested table.
+    """
+    start = _TABLE_START_RE.search(html)
+    if start:
+        end = _TABLE_END_RE.search(html, start.end())
+        if end and not _TABLE_START_RE.search(html, start.end(), end.start()):
+            return lxml.html.fragment_fromstring(html[start.start():end.end()])
+    return lxml.html.fromstring(html)
+
+
+def _find_table(root: HtmlElement) -> Optional[HtmlElement]:
+    """Return the first table in the document (or the root itself if it is one)."""
+    if root.tag == "table":
+        return root
+    return root.find(".//table")
+
+
+def _cell_text(cell: HtmlElement) -> str:
+    """
+    Stripped text content of a table cell.
 
+    Most cells hold plain text, which is read straight from `.text`; only cells
+    with child elements pay for text_content()'s XPath string() evaluation.
+    """
+    if len(cell):
+        return cell.text_content().strip()
+    return (cell.text or "").strip()
+
+
+def _extract_rows(rows: Iterable[HtmlElement]) -> Tuple[List[str], List[Dict[str, Any]], Optional[Dict[str, Any]]]:
+    """
+    Extract column headers, commodity rows and the total row in a single pass.
 
-def _extract_commodities(soup: BeautifulSoup) -> List[Dict[str, Any]]:
-    """Extract commodity rows from the table."""
+    Rows are classified by their cell text: a numeric S. No. marks a commodity
+    row, a cell containing "Total" marks the total row. Stops at the total
+    row once numbered rows have been seen. The numeric columns of all rows are
+    collected as strings and converted in one batch at the end.
+    """
+    headers = []
     commodities = []
-    table = soup.find("table")
-    if not table:
-        return commodities
+    total = None
+    # Every record that receives values, and its value strings, _VALUE_COLUMNS per record
+    records = []
+    raw_values = []
     
-    rows = table.find_all("tr")
-    for row in rows:
-        cells = row.find_all("td")
-        if len(cells) < 5:
-            continue
+    for index, row in enumerate(rows):
+        if index == 0:
+            headers = [_cell_text(cell) for cell in _HEADER_CELLS(row)]
         
-        sno_text = cells[0].get_text(strip=True)
-        if not sno_text.isdigit():
+        texts = [_cell_text(cell) for cell in _CELLS(row)]
+        if len(texts) < 5:
             continue
         
-        # Skip total rows
-        row_text = row.get_text().lower()
-        if "total" in row_text:
+        sno_text = texts[0]
+        if sno_text.isdigit():
+            commodity = {
+                "sno": int(sno_text),
+                "hscode": texts[1],
+                "description": texts[2],
+            }
+            commodities.append(commodity)
+        elif total is None and len(texts) >= 8:
+            label = next((text for text in texts if "Total" in text), None)
+            if label is None:
+                continue
+            total = commodity = {"label": label}
+        else:
             continue
         
-        hscode = cells[1].get_text(strip=True) if len(cells) > 1 else ""
-        description = cells[2].get_text(strip=True) if len(cells) > 2 else ""
+        values = texts[3:3 + _VALUE_COLUMNS]
+        if len(values) < _VALUE_COLUMNS:
+            values += [""] * (_VALUE_COLUMNS - len(values))
+        records.append(commodity)
+        raw_values.extend(values)
         
-        commodity = {
-            "sno": int(sno_text),
-            "hscode": hscode,
-            "description": description,
-            "month_prev_year": _parse_number(cells[3].get_text(strip=True)) if len(cells) > 3 else None,
-            "month_curr_year": _parse_number(cells[4].get_text(strip=True)) if len(cells) > 4 else None,
-            "month_yoy_growth_pct": _parse_number(cells[5].get_text(strip=True)) if len(cells) > 5 else None,
-            "cumulative_prev_year": _parse_number(cells[6].get_text(strip=True)) if len(cells) > 6 else None,
-            "cumulative_curr_year": _parse_number(cells[7].get_text(strip=True)) if len(cells) > 7 else None,
-            "cumulative_yoy_growth_pct": _parse_number(cells[8].get_text(strip=True)) if len(cells) > 8 else None,
-        }
-        commodities.append(commodity)
+        # The total row follows the numbered rows; only footnotes come after it
+        if total is not None and commodities:
+            break
     
-    return commodities
-
-
-def _extract_total(soup: BeautifulSoup) -> Optional[Dict[str, Any]]:
-    """Extract the total row from the table."""
-    table = soup.find("table")
-    if not table:
-        return None
+    numbers = _parse_numbers(raw_values)
+    for offset, record in zip(range(0, len(numbers), _VALUE_COLUMNS), records):
+        record.update(zip(_VALUE_FIELDS, numbers[offset:offset + _VALUE_COLUMNS]))
     
-    for row in table.find_all("tr"):
-        row_text = row.get_text()
-        if "Total" in row_text or "India's Total" in row_text:
-            cells = row.find_all("td")
-            if len(cells) >= 5:
-                # Find the label cell
-                label = ""
-                for cell in cells:
-                    text = cell.get_text(strip=True)
-                    if "Total" in text:
-                        label = text
-                        break
-                
-                if len(cells) >= 8:
-                    return {
-                        "label": label,
-                        "month_prev_year": _parse_number(cells[3].get_text(strip=True)) if len(cells) > 3 else None,
-                        "month_curr_year": _parse_number(cells[4].get_text(strip=True)) if len(cells) > 4 else None,
-                        "month_yoy_growth_pct": _parse_number(cells[5].get_text(strip=True)) if len(cells) > 5 else None,
-                        "cumulative_prev_year": _parse_number(cells[6].get_text(strip=True)) if len(cells) > 6 else None,
-                        "cumulative_curr_year": _parse_number(cells[7].get_text(strip=True)) if len(cells) > 7 else None,
-                        "cumulative_yoy_growth_pct": _parse_number(cells[8].get_text(strip=True)) if len(cells) > 8 else None,
-                    }
-    return None
+    return headers, commodities, total
+
 
+def _extract_report_date(html: str) -> Optional[str]:
+    """
+    Extract the report date from the page.
 
-def _extract_report_date(soup: BeautifulSoup) -> Optional[str]:
-    """Extract the report date from the page."""
-    text = soup.get_text()
-    match = re.search(r"Report Dated?:?\s*(\d{2}\s+\w+\s+\d{4})", text)
+    Searches the raw markup ahead of the first table (tags stripped) and only
+    falls back to the whole page text when the header does not carry the date.
+    """
+    table_start = _TABLE_START_RE.search(html)
+    header = html[:table_start.start()] if table_start else html[:4096]
+    match = _REPORT_DATE_RE.search(unescape(_TAG_RE.sub("", header)))
+    if match is None:
+        match = _REPORT_DATE_RE.search(unescape(_TAG_RE.sub("", html)))
     if match:
         return match.group(1)
     return None
 
 
-def _parse_number(text: str) -> Optional[float]:
-    """Parse a numeric string, handling empty values and formatting."""
-    if not text or text.strip() in ["-", "NA", ""]:
-        return None
+def _parse_numbers(texts: List[str]) -> List[Optional[float]]:
+    """
+    Parse a batch of numeric strings.
+
+    Separators and whitespace are removed from the whole batch with a single
+    translate() over the joined strings rather than once per cell. The common
+    case (numbers and missing-value placeholders only) is converted in one
+    comprehension; a batch containing any other text is redone cell by cell.
+    """
+    if not texts:
+        return []
+    cleaned = _BATCH_SEP.join(texts).translate(_NUM_TRANS).split(_BATCH_SEP)
     try:
-        return float(text.replace(",", "").strip())
+        return [None if text in _EMPTY else float(text) for text in cleaned]
     except ValueError:
-        return None
+        pass
+    
+    numbers = []
+    for text in cleaned:
+        try:
+            numbers.append(None if text in _EMPTY else float(text))
+        except ValueError:
+            numbers.append(None)
+    return numbers
@@ -16,22 +16,32 @@ Usage:
 
     # Use calendar year instead of financial year
     python scrape_meidb_principal_commodity.py --type export --commodity A1 --month 11 --year 2025 --year-type calendar
+
+    # Scrape every principal commodity for November 2025, 16 requests at a time
+    python scrape_meidb_principal_commodity.py --type export --all --month 11 --year 2025
 """
 
 import argparse
+import asyncio
 import sys
 from pathlib import Path
+from typing import Dict, Optional
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
-from tradestat_ingestor.core.session import TradeStatSession
+from tradestat_ingestor.core.git_sync import GitBatch
+from tradestat_ingestor.core.session import TradeStatSession, create_async_client
 from tradestat_ingestor.scrapers.meidb.principal_commodity_wise_all_hscode.scraper import (
     scrape_meidb_principal_commodity_wise_all_hscode,
     PRINCIPAL_COMMODITIES,
     get_commodity_name,
     MONTHS
 )
+from tradestat_ingestor.scrapers.meidb.principal_commodity_wise_all_hscode.scraper_async import (
+    scrape_meidb_principal_commodity_wise_all_hscode_batch,
+    DEFAULT_CONCURRENCY
+)
 from tradestat_ingestor.scrapers.meidb.principal_commodity_wise_all_hscode.parser import (
     parse_meidb_principal_commodity_wise_all_hscode_html
 )
@@ -55,6 +65,64 @@ def print_commodity_list():
     print("=" * 70 + "\n")
 
 
+def _parse_and_save(html: str, commodity_code: str, args) -> Optional[str]:
+    """Parse one response and save it; returns the output path or None."""
+    parsed_data = parse_meidb_principal_commodity_wise_all_hscode_html(
+        html=html,
+        commodity_code=commodity_code,
+        commodity_name=PRINCIPAL_COMMODITIES[commodity_code],
+        month=args.month,
+        year=args.year,
+        trade_type=args.type,
+        value_type=args.value_type,
+        year_type=args.year_type
+    )
+    if not parsed_data:
+        return None
+    return save_meidb_principal_commodity_wise_all_hscode_data(
+        data=parsed_data,
+        base_dir=args.output,
+        trade_type=args.type,
+        commodity_code=commodity_code,
+        month=args.month,
+        year=args.year,
+        value_type=args.value_type,
+        compress=args.compress
+    )
+
+
+async def _scrape_all(args, state: dict, cookies) -> Dict[str, Optional[str]]:
+    """
+    Scrape, parse and save every principal commodity concurrently.
+
+    Parsing and saving run in worker threads so they overlap with other
+    requests' network wait. Returns {commodity_code: output path or None}.
+    """
+    codes = sorted(PRINCIPAL_COMMODITIES)
+    jobs = [
+        {
+            "commodity_code": code,
+            "month": args.month,
+            "year": args.year,
+            "trade_type": args.type,
+            "value_type": args.value_type,
+            "year_type": args.year_type,
+        }
+        for code in codes
+    ]
+    
+    async with create_async_client(BASE_URL, USER_AGENT, cookies, args.concurrency) as client:
+        paths = await scrape_meidb_principal_commodity_wise_all_hscode_batch(
+            client,
+            BASE_URL,
+            jobs,
+            state,
+            args.concurrency,
+            process=lambda job, html: _parse_and_save(html, job["commodity_code"], args)
+        )
+    return dict(zip(codes, paths))
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Scrape MEIDB principal commodity-wise all HSCode data",
@@ -72,6 +140,9 @@ Examples:
 
   # Calendar year instead of financial year
   python scrape_meidb_principal_commodity.py --type export --commodity A1 --month 6 --year 2025 --year-type calendar
+
+  # Every principal commodity for one month
+  python scrape_meidb_principal_commodity.py --type export --all --month 11 --year 2025
         """
     )
     
@@ -87,6 +158,11 @@ Examples:
         "--commodity",
         help="Principal commodity code (e.g., A1=TEA, L3=IRON AND STEEL)"
     )
+    parser.add_argument(
+        "--all",
+        action="store_true",
+        help="Scrape every principal commodity concurrently instead of --commodity"
+    )
     parser.add_argument(
         "--month",
         type=int,
@@ -126,6 +202,28 @@ Examples:
         default=str(DEFAULT_OUTPUT_DIR),
         help=f"Output directory (default: {DEFAULT_OUTPUT_DIR})"
     )
+    parser.add_argument(
+        "--cache-dir",
+        type=str,
+        default=None,
+        help="Cache raw responses in this directory (e.g. <output>/.cache) and reuse them on re-runs (default: disabled; not supported with --all)"
+    )
+    parser.add_argument(
+        "--compress",
+        action="store_true",
+        help="Write zstd-compressed .json.zst output"
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        help=f"Maximum simultaneous requests with --all (default: {DEFAULT_CONCURRENCY})"
+    )
+    parser.add_argument(
+        "--git-push",
+        action="store_true",
+        help="With --all, commit and push the saved files in one batch (repository at --output, branch GIT_BRANCH)"
+    )
     
     args = parser.parse_args()
     
@@ -135,12 +233,18 @@ Examples:
         sys.exit(0)
     
     # Validate required arguments when not listing commodities
-    if not all([args.commodity, args.month, args.year]):
-        print("[!] Error: --commodity, --month, and --year are required")
+    if not all([args.commodity or args.all, args.month, args.year]):
+        print("[!] Error: --commodity (or --all), --month, and --year are required")
         print("    Use --list-commodities to see available codes")
         parser.print_help()
         sys.exit(1)
     
+    if args.all:
+        if args.cache_dir:
+            parser.error("--cache-dir is not supported with --all")
+        scrape_all_commodities(args)
+        return
+    
     # Validate commodity code
     commodity_code = args.commodity.upper()
     if commodity_code not in PRINCIPAL_COMMODITIES:
@@ -180,7 +284,8 @@ Examples:
         trade_type=args.type,
         value_type=args.value_type,
         year_type=args.year_type,
-        state=state
+        state=state,
+        cache_dir=args.cache_dir
     )
     
     if not html:
@@ -228,7 +333,8 @@ Examples:
         commodity_code=commodity_code,
         month=args.month,
         year=args.year,
-        value_type=args.value_type
+        value_type=args.value_type,
+        compress=args.compress
     )
     
     if output_path:
@@ -239,5 +345,40 @@ Examples:
         sys.exit(1)
 
 
+def scrape_all_commodities(args):
+    """Handle --all: scrape every principal commodity for one month."""
+    month_name = MONTHS.get(args.month, str(args.month))
+    
+    print(f"\n[*] Scraping MEIDB PRINCIPAL COMMODITY-WISE ALL HSCODE {args.type.upper()} data for all commodities...")
+    print(f"    Commodities: {len(PRINCIPAL_COMMODITIES)}")
+    print(f"    Period: {month_name} {args.year}")
+    print(f"    Value Type: {args.value_type.upper()}")
+    print(f"    Year Type: {args.year_type.capitalize()}")
+    print(f"    Concurrency: {args.concurrency}")
+    print("-" * 60)
+    
+    trade_session = TradeStatSession(BASE_URL, USER_AGENT)
+    state = trade_session.bootstrap(f"/meidb/principal_commodity_wise_all_HSCode_{args.type}")
+    print("[+] Session bootstrapped successfully")
+    
+    results = asyncio.run(_scrape_all(args, state, trade_session.session.cookies))
+    
+    failed = sorted(code for code, path in results.items() if not path)
+    saved = len(results) - len(failed)
+    print(f"\n[+] Saved {saved}/{len(results)} commodities to: {args.output}")
+    if failed:
+        print(f"[!] Failed: {', '.join(failed)}")
+    if not saved:
+        sys.exit(1)
+    
+    if args.git_push:
+        message = f"Update MEIDB principal commodity {args.type} data for {month_name} {args.year}"
+        with GitBatch(args.output, message, enabled=True) as batch:
+            for path in results.values():
+                if path:
+                    batch.add(path)
+    print("\n[*] Scrape completed successfully!")
+
+
 if __name__ == "__main__":
     main()
@@ -4,23 +4,29 @@ Fetches all HSCode breakdowns for a given principal commodity from MEIDB.
 """
 
 from loguru import logger
-from typing import Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+from tradestat_ingestor.core.response_cache import response_cache
+from tradestat_ingestor.scrapers.meidb.constants import MONTHS
 
 # URL paths for MEIDB principal commodity-wise all HSCode reports
 EXPORT_PATH = "/meidb/principal_commodity_wise_all_HSCode_export"
 IMPORT_PATH = "/meidb/principal_commodity_wise_all_HSCode_import"
 
-# Month mapping
-MONTHS = {
-    1: "January", 2: "February", 3: "March", 4: "April",
-    5: "May", 6: "June", 7: "July", 8: "August",
-    9: "September", 10: "October", 11: "November", 12: "December"
-}
-
 # Value type mapping for form submission
 VALUE_TYPES = {"usd": "1", "quantity": "2", "inr": "3"}
 YEAR_TYPES = {"financial": "1", "calendar": "2"}
 
+# Response chunk size for streamed downloads
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# trade_type -> (URL path, form field names). Field names have a 'p' prefix for
+# export and an 'imp' prefix for import, in payload order:
+# month, year, commodity, report value, report year
+_TRADE_DISPATCH = {
+    "export": (EXPORT_PATH, ("pddMonth", "pddYear", "pbrcitmdata", "pddReportVal", "pddReportYear")),
+    "import": (IMPORT_PATH, ("impddMonth", "impddYear", "impbrcitmdata", "impddReportVal", "impddReportYear")),
+}
+
 # Principal commodity codes mapping
 PRINCIPAL_COMMODITIES = {
     "A1": "TEA", "A2": "COFFEE", "A3": "RICE -BASMOTI", "A4": "RICE(OTHER THAN BASMOTI)",
@@ -78,12 +84,19 @@ PRINCIPAL_COMMODITIES = {
     "S5": "PETROLEUM: CRUDE", "S6": "PETROLEUM PRODUCTS", "ZZ": "OTHER COMMODITIES",
 }
 
+# Valid (upper-case) principal commodity codes, for validation
+_COMMODITY_CODES = frozenset(PRINCIPAL_COMMODITIES)
+
 
 def get_commodity_name(code: str) -> str:
     """Get the commodity name for a given principal commodity code."""
     return PRINCIPAL_COMMODITIES.get(code.upper(), code)
 
 
+@response_cache(
+    ("trade_type", "commodity_code", "month", "year", "value_type", "year_type"),
+    codec="zstd"
+)
 def scrape_meidb_principal_commodity_wise_all_hscode(
     session,
     base_url: str,
@@ -108,54 +121,19 @@ def scrape_meidb_principal_commodity_wise_all_hscode(
         value_type: "usd" (US $ Million), "inr" (₹ Crore), or "quantity"
         year_type: "financial" or "calendar"
         state: Dictionary containing CSRF token and other auth state
+        cache_dir: (keyword-only, added by @response_cache) directory for cached
+                   zstd-compressed responses; caching is disabled when omitted
 
     Returns:
         HTML response as string, or None if request fails
     """
-    # Validate month
-    if month < 1 or month > 12:
-        logger.error(f"Invalid month: {month}. Must be 1-12")
-        return None
-
-    # Validate commodity code
     commodity_code = commodity_code.upper()
-    if commodity_code not in PRINCIPAL_COMMODITIES:
-        logger.error(f"Invalid commodity code: {commodity_code}")
-        return None
-
-    # Determine the URL path based on trade type
-    if trade_type.lower() == "export":
-        path = EXPORT_PATH
-    elif trade_type.lower() == "import":
-        path = IMPORT_PATH
-    else:
-        logger.error(f"Invalid trade_type: {trade_type}. Must be 'export' or 'import'")
+    request = _build_request(commodity_code, month, year, trade_type, value_type, year_type, _csrf_token(state))
+    if request is None:
         return None
+    path, payload = request
 
-    # Build payload - field names have 'p' prefix for export, 'imp' prefix for import
-    # Export: pddMonth, pddYear, pbrcitmdata, pddReportVal, pddReportYear
-    # Import: impddMonth, impddYear, impbrcitmdata, impddReportVal, impddReportYear
-    if trade_type.lower() == "export":
-        payload = {
-            "_token": state.get("_token", "") if state else "",
-            "pddMonth": str(month),
-            "pddYear": str(year),
-            "pbrcitmdata": commodity_code,
-            "pddReportVal": VALUE_TYPES.get(value_type.lower(), "1"),
-            "pddReportYear": YEAR_TYPES.get(year_type.lower(), "1"),
-        }
-    else:
-        # Import uses 'imp' prefix for all field names
-        payload = {
-            "_token": state.get("_token", "") if state else "",
-            "impddMonth": str(month),
-            "impddYear": str(year),
-            "impbrcitmdata": commodity_code,
-            "impddReportVal": VALUE_TYPES.get(value_type.lower(), "1"),
-            "impddReportYear": YEAR_TYPES.get(year_type.lower(), "1"),
-        }
-
-    commodity_name = get_commodity_name(commodity_code)
+    commodity_name = PRINCIPAL_COMMODITIES[commodity_code]
     logger.info(f"Fetching MEIDB principal commodity data: {commodity_name} ({commodity_code}), {MONTHS.get(month)}/{year}, {trade_type}")
 
     try:
@@ -166,3 +144,140 @@ def scrape_meidb_principal_commodity_wise_all_hscode(
     except Exception as e:
         logger.error(f"Fetch failed: {e}")
         return None
+
+
+def scrape_meidb_principal_commodity_wise_all_hscode_many(
+    session,
+    base_url: str,
+    jobs: Iterable[Dict[str, Any]],
+    state: dict = None,
+    cache_dir=None
+) -> List[Optional[str]]:
+    """
+    Scrape many principal commodity reports over one session.
+
+    Requests go out one after another on the same requests.Session, so its
+    keep-alive connection pool (see TradeStatSession) is reused instead of
+    opening a new TCP/TLS connection per report.
+
+    Args:
+        session: requests.Session object with CSRF token support
+        base_url: Base URL of tradestat website
+        jobs: Iterable of keyword dicts with commodity_code, month, year and
+              optionally trade_type, value_type, year_type
+        state: Dictionary containing CSRF token and other auth state
+        cache_dir: Directory for cached responses; caching is disabled when omitted
+
+    Returns:
+        List of HTML responses (None for failed requests), in the same order as `jobs`
+    """
+    return [
+        scrape_meidb_principal_commodity_wise_all_hscode(
+            session, base_url, state=state, cache_dir=cache_dir, **job
+        )
+        for job in jobs
+    ]
+
+
+def scrape_meidb_principal_commodity_wise_all_hscode_stream(
+    session,
+    base_url: str,
+    commodity_code: str,
+    month: int,
+    year: int,
+    trade_type: str = "export",
+    value_type: str = "usd",
+    year_type: str = "financial",
+    state: dict = None,
+    chunk_size: int = STREAM_CHUNK_SIZE
+) -> Optional[Iterator[bytes]]:
+    """
+    Streaming variant of scrape_meidb_principal_commodity_wise_all_hscode.
+
+    Returns an iterator over the raw response body instead of the full text,
+    for parse_meidb_principal_commodity_wise_all_hscode_stream. The response is
+    closed once the iterator is exhausted; errors while reading propagate to
+    the consumer.
+
+    Args:
+        session: requests.Session object with CSRF token support
+        base_url: Base URL of tradestat website
+        commodity_code: Principal commodity code (e.g., A1=TEA, L3=IRON AND STEEL)
+        month: Month (1-12)
+        year: Year (e.g., 2024, 2025)
+        trade_type: "export" or "import"
+        value_type: "usd" (US $ Million), "inr" (₹ Crore), or "quantity"
+        year_type: "financial" or "calendar"
+        state: Dictionary containing CSRF token and other auth state
+        chunk_size: Bytes per chunk
+
+    Returns:
+        Iterator of response body chunks, or None if the request fails
+    """
+    commodity_code = commodity_code.upper()
+    request = _build_request(commodity_code, month, year, trade_type, value_type, year_type, _csrf_token(state))
+    if request is None:
+        return None
+    path, payload = request
+
+    commodity_name = PRINCIPAL_COMMODITIES[commodity_code]
+    logger.info(f"Streaming MEIDB principal commodity data: {commodity_name} ({commodity_code}), {MONTHS.get(month)}/{year}, {trade_type}")
+
+    try:
+        resp = session.post(base_url + path, data=payload, timeout=120, stream=True)
+        resp.raise_for_status()
+    except Exception as e:
+        logger.error(f"Fetch failed: {e}")
+        return None
+
+    def _chunks() -> Iterator[bytes]:
+        with resp:
+            yield from resp.iter_content(chunk_size)
+
+    return _chunks()
+
+
+def _build_request(
+    commodity_code: str,
+    month: int,
+    year: int,
+    trade_type: str,
+    value_type: str,
+    year_type: str,
+    token: str
+) -> Optional[Tuple[str, Dict[str, str]]]:
+    """
+    Validate the request parameters and build the URL path and form payload.
+
+    `commodity_code` must already be upper-cased by the caller, and `token`
+    resolved from the session state (see _csrf_token).
+
+    Returns:
+        (path, payload) tuple, or None if the parameters are invalid
+    """
+    # Validate month
+    if month < 1 or month > 12:
+        logger.error(f"Invalid month: {month}. Must be 1-12")
+        return None
+
+    # Validate commodity code
+    if commodity_code not in _COMMODITY_CODES:
+        logger.error(f"Invalid commodity code: {commodity_code}")
+        return None
+
+    dispatch = _TRADE_DISPATCH.get(trade_type.lower())
+    if dispatch is None:
+        logger.error(f"Invalid trade_type: {trade_type}. Must be 'export' or 'import'")
+        return None
+    path, fields = dispatch
+    report_value = VALUE_TYPES.get(value_type.lower(), "1")
+    report_year = YEAR_TYPES.get(year_type.lower(), "1")
+
+    payload = {"_token": token}
+    payload.update(zip(fields, (str(month), str(year), commodity_code, report_value, report_year)))
+    return path, payload
+
+
+def _csrf_token(state: Optional[dict]) -> str:
+    """CSRF token from a bootstrapped session state, or "" without one."""
+    return state.get("_token", "") if state else ""
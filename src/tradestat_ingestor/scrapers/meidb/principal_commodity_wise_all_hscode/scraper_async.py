@@ -0,0 +1,137 @@
+"""
+Async MEIDB Principal Commodity-wise All HSCode scraper.
+Fetches many principal commodity reports concurrently over one HTTP/2 client.
+"""
+
+import asyncio
+from loguru import logger
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+import httpx
+
+from tradestat_ingestor.core.session import create_async_client
+from .scraper import MONTHS, PRINCIPAL_COMMODITIES, _build_request, _csrf_token
+
+# Maximum number of in-flight POSTs per batch
+DEFAULT_CONCURRENCY = 16
+
+
+async def scrape_meidb_principal_commodity_wise_all_hscode_async(
+    client: httpx.AsyncClient,
+    base_url: str,
+    commodity_code: str,
+    month: int,
+    year: int,
+    trade_type: str = "export",
+    value_type: str = "usd",
+    year_type: str = "financial",
+    state: dict = None
+) -> Optional[str]:
+    """
+    Async variant of scrape_meidb_principal_commodity_wise_all_hscode.
+
+    Args:
+        client: httpx.AsyncClient sharing cookies with the bootstrapped session
+        base_url: Base URL of tradestat website
+        commodity_code: Principal commodity code (e.g., A1=TEA, L3=IRON AND STEEL)
+        month: Month (1-12)
+        year: Year (e.g., 2024, 2025)
+        trade_type: "export" or "import"
+        value_type: "usd" (US $ Million), "inr" (₹ Crore), or "quantity"
+        year_type: "financial" or "calendar"
+        state: Dictionary containing CSRF token and other auth state
+
+    Returns:
+        HTML response as string, or None if request fails
+    """
+    commodity_code = commodity_code.upper()
+    request = _build_request(commodity_code, month, year, trade_type, value_type, year_type, _csrf_token(state))
+    if request is None:
+        return None
+    path, payload = request
+
+    commodity_name = PRINCIPAL_COMMODITIES[commodity_code]
+    logger.info(f"Fetching MEIDB principal commodity data: {commodity_name} ({commodity_code}), {MONTHS.get(month)}/{year}, {trade_type}")
+
+    try:
+        resp = await client.post(base_url + path, data=payload, timeout=120)
+        resp.raise_for_status()
+        logger.success(f"Fetch successful: {commodity_code}, {len(resp.text)} bytes")
+        return resp.text
+    except Exception as e:
+        logger.error(f"Fetch failed: {commodity_code}, {e}")
+        return None
+
+
+async def scrape_meidb_principal_commodity_wise_all_hscode_batch(
+    client: httpx.AsyncClient,
+    base_url: str,
+    jobs: Iterable[Dict[str, Any]],
+    state: dict,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    process: Optional[Callable[[Dict[str, Any], str], Any]] = None
+) -> List[Any]:
+    """
+    Scrape many reports concurrently, at most `concurrency` requests in flight.
+
+    With `process`, each response is handed to process(job, html) in a worker
+    thread as soon as it arrives, so processing overlaps the remaining
+    requests, and its return value is collected instead of the HTML.
+
+    Args:
+        client: httpx.AsyncClient sharing cookies with the bootstrapped session
+        base_url: Base URL of tradestat website
+        jobs: Iterable of keyword dicts with commodity_code, month, year and
+              optionally trade_type, value_type, year_type
+        state: Dictionary containing CSRF token and other auth state
+        concurrency: Maximum number of simultaneous requests
+        process: Optional callable applied to each successful (job, html) pair
+
+    Returns:
+        List of HTML responses, or of process() results when given (None for
+        failed requests), in the same order as `jobs`
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _run(job: Dict[str, Any]) -> Any:
+        async with semaphore:
+            html = await scrape_meidb_principal_commodity_wise_all_hscode_async(
+                client, base_url, state=state, **job
+            )
+        if html is None or process is None:
+            return html
+        return await asyncio.to_thread(process, job, html)
+
+    return await asyncio.gather(*(_run(job) for job in jobs))
+
+
+def scrape_meidb_principal_commodity_wise_all_hscode_concurrent(
+    base_url: str,
+    user_agent: str,
+    jobs: Iterable[Dict[str, Any]],
+    state: dict,
+    cookies=None,
+    concurrency: int = DEFAULT_CONCURRENCY
+) -> List[Optional[str]]:
+    """
+    Synchronous entry point for concurrent batch scraping; runs the async batch
+    driver on a fresh event loop with its own client.
+
+    Args:
+        base_url: Base URL of tradestat website
+        user_agent: User-Agent header value
+        jobs: Iterable of keyword dicts (see scrape_meidb_principal_commodity_wise_all_hscode_batch)
+        state: Dictionary containing CSRF token and other auth state
+        cookies: Cookie jar from the session that produced `state`
+        concurrency: Maximum number of simultaneous requests
+
+    Returns:
+        List of HTML responses (None for failed requests), in the same order as `jobs`
+    """
+    async def _main() -> List[Optional[str]]:
+        async with create_async_client(base_url, user_agent, cookies, concurrency) as client:
+            return await scrape_meidb_principal_commodity_wise_all_hscode_batch(
+                client, base_url, jobs, state, concurrency
+            )
+
+    return asyncio.run(_main())
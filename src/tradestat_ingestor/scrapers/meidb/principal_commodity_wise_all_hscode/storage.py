@@ -2,22 +2,35 @@
 Storage for MEIDB Principal Commodity-wise All HSCode data.
 """
 
-import json
 import os
+from functools import lru_cache
 from typing import Dict, Any
 from loguru import logger
 from datetime import datetime
+from tradestat_ingestor.core.serialization import compress_zstd, dumps_json, ensure_dir, write_bytes
+from tradestat_ingestor.scrapers.meidb.constants import MONTH_ABBR
 
-MONTH_ABBR = {
-    1: "jan", 2: "feb", 3: "mar", 4: "apr", 5: "may", 6: "jun",
-    7: "jul", 8: "aug", 9: "sep", 10: "oct", 11: "nov", 12: "dec"
-}
 
+@lru_cache(maxsize=64)
+def _dir_for(base_dir: str, trade_type: str) -> str:
+    """Output directory for a (base_dir, trade_type) combination."""
+    return os.path.join(base_dir, "meidb", "principal_commodity_wise_all_hscode", trade_type.lower())
 
-def get_output_path(base_dir: str, trade_type: str, commodity_code: str, month: int, year: int, value_type: str) -> str:
+
+def get_output_path(
+    base_dir: str,
+    trade_type: str,
+    commodity_code: str,
+    month: int,
+    year: int,
+    value_type: str,
+    compress: bool = False
+) -> str:
     """
     Generate the output file path for the scraped data.
     
+    With compress=True the file extension is .json.zst.
+    
     Args:
         base_dir: Base directory for output
         trade_type: "export" or "import"
@@ -25,13 +38,16 @@ def get_output_path(base_dir: str, trade_type: str, commodity_code: str, month:
         month: Month (1-12)
         year: Year
         value_type: "usd", "inr", or "quantity"
+        compress: Whether the file is zstd-compressed
     
     Returns:
         Full path to the output file
     """
-    output_dir = os.path.join(base_dir, "meidb", "principal_commodity_wise_all_hscode", trade_type.lower())
+    output_dir = _dir_for(base_dir, trade_type)
     month_abbr = MONTH_ABBR.get(month, str(month))
     filename = f"{commodity_code.lower()}_{month_abbr}_{year}_{value_type}.json"
+    if compress:
+        filename += ".zst"
     return os.path.join(output_dir, filename)
 
 
@@ -42,7 +58,8 @@ def save_meidb_principal_commodity_wise_all_hscode_data(
     commodity_code: str,
     month: int,
     year: int,
-    value_type: str
+    value_type: str,
+    compress: bool = False
 ) -> str:
     """
     Save the scraped data to a JSON file.
@@ -55,12 +72,13 @@ def save_meidb_principal_commodity_wise_all_hscode_data(
         month: Month (1-12)
         year: Year
         value_type: "usd", "inr", or "quantity"
+        compress: Write zstd-compressed .json.zst instead of plain JSON
     
     Returns:
         Path to the saved file
     """
-    output_path = get_output_path(base_dir, trade_type, commodity_code, month, year, value_type)
-    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    output_path = get_output_path(base_dir, trade_type, commodity_code, month, year, value_type, compress)
+    ensure_dir(os.path.dirname(output_path))
     
     # Add storage metadata
     data["storage"] = {
@@ -68,8 +86,12 @@ def save_meidb_principal_commodity_wise_all_hscode_data(
         "file_path": output_path
     }
     
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    # Same layout as json.dump(indent=2, ensure_ascii=False) apart from float
+    # exponents and NaN/Infinity (written as null); see dumps_json
+    buf = dumps_json(data)
+    if compress:
+        buf = compress_zstd(buf)
+    write_bytes(output_path, buf)
     
     logger.success(f"Saved principal commodity data to: {output_path}")
     return output_path